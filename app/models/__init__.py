@@ -1,77 +1,185 @@
 """
 Models package for EchoAI FastAPI service.
 Exports all Pydantic models for use across the application.
+
+Submodules are imported lazily on first attribute access, so importing
+``app.models.chat`` no longer builds the schemas of every other model
+module as a side effect.
 """
+import importlib
 
-# Import all models to make them available when importing from app.models
-from .chat import *
-from .decision import *
-from .enhanced_lead import *
-from .enhanced_streaming import *
-from .escalation import *
-from .ingest import *
-from .instruction import *
-from .lead import *
-from .memory import *
-from .simple_instruction import *
-from .vision import *
-
-__all__ = [
+# Public model names by submodule. Where two submodules define the same
+# name, the later entry wins, matching the previous star-import order.
+_MODEL_MODULES = {
     # Chat models
-    "ChatRequest",
-    "ChatResponse", 
-    "StreamingChatResponse",
-    "ChatMessage",
-    "ChatHistory",
-    
+    "chat": [
+        "ChatRequest",
+        "ChatRequestWithApiKey",
+        "ChatResponse",
+        "RAGContext",
+        "ConversationMessage",
+        "StreamChatResponse",
+        "StreamChatRequest",
+    ],
+
     # Decision models
-    "DecisionRequest",
-    "DecisionResponse",
-    "DecisionContext",
-    
+    "decision": [
+        "ConversationContextType",
+        "ProactiveActionType",
+        "ConversationContext",
+        "ProactiveAction",
+        "ConversationIntelligence",
+        "EnhancedChatResponse",
+        "ConversationTurn",
+        "DecisionRequest",
+        "DecisionResponse",
+    ],
+
     # Enhanced lead models
-    "EnhancedLeadRequest",
-    "EnhancedLeadResponse",
-    "LeadAnalysis",
-    "LeadScore",
-    
+    "enhanced_lead": [
+        "CollectionStrategy",
+        "QualificationStage",
+        "LeadPriority",
+        "LeadStatus",
+        "ContactInfo",
+        "QualificationData",
+        "ConversationMetrics",
+        "LeadSignals",
+        "QualificationQuestion",
+        "LeadAnalysis",
+        "EnhancedLeadData",
+        "LeadCollectionRequest",
+        "LeadCollectionResponse",
+        "LeadConversationMessage",
+        "LeadQualificationRequest",
+        "LeadQualificationResponse",
+        "LeadScoringFactors",
+        "LeadScoringConfig",
+        "BulkLeadAnalysisRequest",
+        "BulkLeadAnalysisResponse",
+    ],
+
     # Enhanced streaming models
-    "StreamingRequest",
-    "StreamingResponse",
-    "StreamingChunk",
-    
+    "enhanced_streaming": [
+        "StreamResponseType",
+        "FallbackStrategy",
+        "EnhancedStreamResponse",
+        "EnhancedStreamRequest",
+        "EnhancedStreamRequestWithApiKey",
+        "StreamingConfig",
+    ],
+
     # Escalation models
-    "EscalationRequest",
-    "EscalationResponse",
-    "EscalationContext",
-    
+    "escalation": [
+        "EscalationType",
+        "EscalationStatus",
+        "UrgencyLevel",
+        "EscalationTrigger",
+        "EscalationSignals",
+        "EscalationResponse",
+        "EscalationRequest",
+        "NotificationResult",
+        "EscalationAnalysis",
+        "ConversationContext",
+        "EscalationMetrics",
+        "AgentNotification",
+    ],
+
     # Ingest models
-    "IngestRequest",
-    "IngestResponse",
-    "ProcessingStats",
-    "VectorStorageStats",
-    
+    "ingest": [
+        "IngestRequest",
+        "IngestResponse",
+        "ProcessingStats",
+        "VectorStorageStats",
+    ],
+
     # Instruction models
-    "InstructionRequest",
-    "InstructionResponse",
-    "InstructionUpdate",
-    
+    "instruction": [
+        "InstructionType",
+        "TrainingInstructionCreate",
+        "TrainingInstructionUpdate",
+        "TrainingInstructionResponse",
+        "InstructionListResponse",
+        "InstructionBulkImportRequest",
+        "InstructionBulkImportResponse",
+        "InstructionTestRequest",
+        "InstructionTestResponse",
+        "EnhancedTrainRequest",
+        "EnhancedTrainResponse",
+    ],
+
     # Lead models
-    "LeadRequest",
-    "LeadResponse",
-    "LeadData",
-    
+    "lead": [
+        "LeadPriority",
+        "LeadType",
+        "ConversationContextRequest",
+        "LeadAnalysisRequest",
+        "ScoringFactors",
+        "ExtractedContactData",
+        "LeadScoreResponse",
+        "LeadTriggerMetadata",
+        "LeadQualificationTrigger",
+        "CRMLeadData",
+        "LeadQualificationStats",
+    ],
+
     # Memory models
-    "MemoryRequest",
-    "MemoryResponse",
-    "MemoryItem",
-    
+    "memory": [
+        "MemoryType",
+        "ShortTermMessage",
+        "MemoryMessagePayload",
+        "ConversationSummaryModel",
+        "UserProfileModel",
+        "ContextualFactModel",
+        "TopicTransitionModel",
+        "ConversationMemoryModel",
+        "MemoryRetrievalRequest",
+        "MemoryRetrievalResponse",
+        "MemoryUpdateRequest",
+        "MemoryUpdateResponse",
+        "ConversationContextRequest",
+        "ConversationContextResponse",
+        "MemoryServiceStatus",
+    ],
+
     # Simple instruction models
-    "ChatbotInstructionUpdate",
-    "ChatbotInstructionResponse",
-    "ChatbotWithInstructionResponse",
+    "simple_instruction": [
+        "ChatbotInstructionUpdate",
+        "ChatbotInstructionResponse",
+        "ChatbotWithInstructionResponse",
+    ],
+
     # Vision models
-    "VisionRequest",
-    "VisionResponse",
-    "ImageAnalysis",
-]
+    "vision": [
+        "AnalysisType",
+        "VisionAnalysisRequest",
+        "ProductCondition",
+        "InvoiceData",
+        "InventoryCount",
+        "VisionAnalysisResponse",
+        "ImageAnalysisRecord",
+        "VisionError",
+    ],
+}
+
+_EXPORTS = {
+    name: module
+    for module, names in _MODEL_MODULES.items()
+    for name in names
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,11 @@
 """
 Pydantic models for intelligent decision-making system.
 """
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
+import time
 
 
 class ConversationContextType(str, Enum):
@@ -31,38 +32,56 @@ class ProactiveActionType(str, Enum):
     NONE = "none"
 
 
+def _conversation_context_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ConversationContext example to its JSON schema."""
+    schema["example"] = {
+        "message_count": 3,
+        "conversation_length": 450,
+        "context_type": "question",
+        "sentiment_score": 0.2,
+        "sentiment_trend": [0.1, 0.0, 0.2],
+        "engagement_score": 0.8,
+        "confusion_indicators": ["what do you mean", "I don't understand"],
+        "satisfaction_indicators": [],
+        "topic_changes": 1,
+        "last_response_helpful": True,
+        "user_intent_clarity": 0.7,
+        "knowledge_gaps": ["pricing details"]
+    }
+
+
 class ConversationContext(BaseModel):
     """Model for conversation context analysis."""
     message_count: int = Field(..., description="Number of messages in conversation", ge=0)
     conversation_length: int = Field(..., description="Total character length of conversation", ge=0)
     context_type: ConversationContextType = Field(..., description="Type of current message context")
     sentiment_score: float = Field(..., description="Current message sentiment score", ge=-1.0, le=1.0)
-    sentiment_trend: List[float] = Field(default_factory=list, description="Recent sentiment scores")
+    sentiment_trend: List[float] = Field(default_factory=list, description="Recent sentiment scores", max_length=10)
     engagement_score: float = Field(..., description="User engagement level", ge=0.0, le=1.0)
-    confusion_indicators: List[str] = Field(default_factory=list, description="Indicators of user confusion")
-    satisfaction_indicators: List[str] = Field(default_factory=list, description="Indicators of user satisfaction")
+    confusion_indicators: List[str] = Field(default_factory=list, description="Indicators of user confusion", max_length=20)
+    satisfaction_indicators: List[str] = Field(default_factory=list, description="Indicators of user satisfaction", max_length=20)
     topic_changes: int = Field(default=0, description="Number of topic changes in conversation", ge=0)
     last_response_helpful: Optional[bool] = Field(None, description="Whether last response was helpful")
     user_intent_clarity: float = Field(..., description="Clarity of user intent", ge=0.0, le=1.0)
     knowledge_gaps: List[str] = Field(default_factory=list, description="Identified knowledge gaps")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "message_count": 3,
-                "conversation_length": 450,
-                "context_type": "question",
-                "sentiment_score": 0.2,
-                "sentiment_trend": [0.1, 0.0, 0.2],
-                "engagement_score": 0.8,
-                "confusion_indicators": ["what do you mean", "I don't understand"],
-                "satisfaction_indicators": [],
-                "topic_changes": 1,
-                "last_response_helpful": True,
-                "user_intent_clarity": 0.7,
-                "knowledge_gaps": ["pricing details"]
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        use_enum_values=True,
+        json_schema_extra=_conversation_context_schema_extra
+    )
+
+
+def _proactive_action_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ProactiveAction example to its JSON schema."""
+    schema["example"] = {
+        "action_type": "ask_followup",
+        "priority": 0.8,
+        "content": "Would you like to know more about our pricing plans?",
+        "reasoning": "User asked about features but didn't inquire about cost",
+        "confidence": 0.75,
+        "metadata": {"related_topics": ["pricing", "plans"]}
+    }
 
 
 class ProactiveAction(BaseModel):
@@ -74,17 +93,31 @@ class ProactiveAction(BaseModel):
     confidence: float = Field(..., description="Confidence in this action", ge=0.0, le=1.0)
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata for the action")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "action_type": "ask_followup",
-                "priority": 0.8,
-                "content": "Would you like to know more about our pricing plans?",
-                "reasoning": "User asked about features but didn't inquire about cost",
-                "confidence": 0.75,
-                "metadata": {"related_topics": ["pricing", "plans"]}
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        use_enum_values=True,
+        json_schema_extra=_proactive_action_schema_extra
+    )
+
+
+def _conversation_intelligence_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ConversationIntelligence example to its JSON schema."""
+    schema["example"] = {
+        "conversation_id": "conv_123",
+        "user_id": "user_456",
+        "chatbot_id": "bot_789",
+        "context_understanding": 0.85,
+        "proactive_score": 0.7,
+        "helpfulness_score": 0.9,
+        "conversation_flow_score": 0.8,
+        "user_satisfaction_prediction": 0.85,
+        "escalation_risk": 0.1,
+        "lead_potential": 0.6,
+        "topics_covered": ["pricing", "features", "support"],
+        "user_goals_identified": ["evaluate_product", "compare_options"],
+        "knowledge_gaps_found": ["integration_details"],
+        "created_at": "2024-01-15T10:30:00Z"
+    }
 
 
 class ConversationIntelligence(BaseModel):
@@ -102,27 +135,69 @@ class ConversationIntelligence(BaseModel):
     topics_covered: List[str] = Field(default_factory=list, description="Topics discussed in conversation")
     user_goals_identified: List[str] = Field(default_factory=list, description="Identified user goals")
     knowledge_gaps_found: List[str] = Field(default_factory=list, description="Knowledge gaps discovered")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Analysis timestamp")
+    created_at: int = Field(
+        default_factory=time.time_ns,
+        description="Analysis timestamp (epoch nanoseconds, serialized as ISO 8601)",
+        json_schema_extra={"type": "string", "format": "date-time"}
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_conversation_intelligence_schema_extra
+    )
+    
+    @field_validator('created_at', mode='before')
+    @classmethod
+    def coerce_created_at(cls, v):
+        """Accept datetimes and ISO 8601 strings and store them as epoch nanoseconds."""
+        if isinstance(v, str):
+            try:
+                v = datetime.fromisoformat(v.replace('Z', '+00:00'))
+            except ValueError:
+                return v
+        if isinstance(v, datetime):
+            if v.tzinfo is None:
+                v = v.replace(tzinfo=timezone.utc)
+            return int(v.timestamp() * 1_000_000) * 1000
+        return v
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "conversation_id": "conv_123",
-                "user_id": "user_456",
-                "chatbot_id": "bot_789",
-                "context_understanding": 0.85,
-                "proactive_score": 0.7,
-                "helpfulness_score": 0.9,
-                "conversation_flow_score": 0.8,
-                "user_satisfaction_prediction": 0.85,
-                "escalation_risk": 0.1,
-                "lead_potential": 0.6,
-                "topics_covered": ["pricing", "features", "support"],
-                "user_goals_identified": ["evaluate_product", "compare_options"],
-                "knowledge_gaps_found": ["integration_details"],
-                "created_at": "2024-01-15T10:30:00Z"
+    @field_serializer('created_at')
+    def serialize_created_at(self, created_at: int) -> str:
+        """Render the nanosecond timestamp as an ISO 8601 UTC string."""
+        return datetime.fromtimestamp(created_at / 1e9, tz=timezone.utc).isoformat()
+
+
+def _enhanced_chat_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the EnhancedChatResponse example to its JSON schema."""
+    schema["example"] = {
+        "response": "Based on your needs, our Pro plan would be perfect for you. It includes advanced analytics and priority support.",
+        "proactive_questions": [
+            "Would you like to see a demo of the analytics features?",
+            "Do you have any questions about our implementation process?"
+        ],
+        "suggested_topics": ["demo_scheduling", "implementation_timeline", "pricing_details"],
+        "conversation_actions": [
+            {
+                "action_type": "ask_followup",
+                "priority": 0.8,
+                "content": "Would you like to schedule a demo?",
+                "reasoning": "User showed interest in features",
+                "confidence": 0.75
             }
-        }
+        ],
+        "intelligence_metadata": {
+            "conversation_id": "conv_123",
+            "user_id": "user_456",
+            "context_understanding": 0.85,
+            "proactive_score": 0.7,
+            "helpfulness_score": 0.9
+        },
+        "context_used": True,
+        "sources_count": 3,
+        "confidence_score": 0.85,
+        "sentiment": "positive",
+        "sentiment_score": 0.7,
+        "conversation_id": "conv_123"
+    }
 
 
 class EnhancedChatResponse(BaseModel):
@@ -146,68 +221,78 @@ class EnhancedChatResponse(BaseModel):
     image_analysis: Optional[Dict[str, Any]] = Field(None, description="Image analysis results if image was uploaded")
     lead_analysis: Optional[Dict[str, Any]] = Field(None, description="Lead qualification analysis if qualified")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "response": "Based on your needs, our Pro plan would be perfect for you. It includes advanced analytics and priority support.",
-                "proactive_questions": [
-                    "Would you like to see a demo of the analytics features?",
-                    "Do you have any questions about our implementation process?"
-                ],
-                "suggested_topics": ["demo_scheduling", "implementation_timeline", "pricing_details"],
-                "conversation_actions": [
-                    {
-                        "action_type": "ask_followup",
-                        "priority": 0.8,
-                        "content": "Would you like to schedule a demo?",
-                        "reasoning": "User showed interest in features",
-                        "confidence": 0.75
-                    }
-                ],
-                "intelligence_metadata": {
-                    "conversation_id": "conv_123",
-                    "user_id": "user_456",
-                    "context_understanding": 0.85,
-                    "proactive_score": 0.7,
-                    "helpfulness_score": 0.9
-                },
-                "context_used": True,
-                "sources_count": 3,
-                "confidence_score": 0.85,
-                "sentiment": "positive",
-                "sentiment_score": 0.7,
-                "conversation_id": "conv_123"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_enhanced_chat_response_schema_extra
+    )
+
+
+class ConversationTurn(BaseModel):
+    """Model for a single previous message in a decision request."""
+    role: Literal['user', 'assistant'] = Field(..., description="Message role: 'user' or 'assistant'")
+    content: str = Field(..., description="Message content")
+    
+    model_config = ConfigDict(extra='ignore')
+
+
+def _decision_request_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the DecisionRequest example to its JSON schema."""
+    schema["example"] = {
+        "user_id": "user_456",
+        "chatbot_id": "bot_789",
+        "conversation_id": "conv_123",
+        "conversation_history": [
+            {"role": "user", "content": "Hi, I'm interested in your product"},
+            {"role": "assistant", "content": "Hello! I'd be happy to help you learn about our product."}
+        ],
+        "context_documents": [
+            {"content": "Pricing information...", "similarity_score": 0.9}
+        ],
+        "message": "What are your pricing plans?",
+        "rag_response": "We offer three pricing plans: Basic, Pro, and Enterprise."
+    }
 
 
 class DecisionRequest(BaseModel):
     """Request model for decision-making analysis."""
-    message: str = Field(..., description="Current user message")
-    conversation_history: List[Dict[str, Any]] = Field(default_factory=list, description="Previous conversation messages")
+    # Stable identifiers and the append-only history come first and
+    # per-turn content last, so dumps of requests in the same
+    # conversation share a common prefix
     user_id: str = Field(..., description="User ID")
     chatbot_id: Optional[str] = Field(None, description="Chatbot ID for widget conversations")
     conversation_id: Optional[str] = Field(None, description="Conversation ID")
-    rag_response: Optional[str] = Field(None, description="Generated RAG response for enhancement")
+    conversation_history: List[ConversationTurn] = Field(default_factory=list, description="Previous conversation messages")
     context_documents: List[Dict[str, Any]] = Field(default_factory=list, description="Retrieved context documents")
+    message: str = Field(..., description="Current user message")
+    rag_response: Optional[str] = Field(None, description="Generated RAG response for enhancement")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "message": "What are your pricing plans?",
-                "conversation_history": [
-                    {"role": "user", "content": "Hi, I'm interested in your product"},
-                    {"role": "assistant", "content": "Hello! I'd be happy to help you learn about our product."}
-                ],
-                "user_id": "user_456",
-                "chatbot_id": "bot_789",
-                "conversation_id": "conv_123",
-                "rag_response": "We offer three pricing plans: Basic, Pro, and Enterprise.",
-                "context_documents": [
-                    {"content": "Pricing information...", "similarity_score": 0.9}
-                ]
+    model_config = ConfigDict(
+        json_schema_extra=_decision_request_schema_extra
+    )
+
+
+def _decision_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the DecisionResponse example to its JSON schema."""
+    schema["example"] = {
+        "enhanced_response": "We offer three pricing plans tailored to different needs. Would you like me to explain which plan might work best for your specific requirements?",
+        "conversation_context": {
+            "message_count": 2,
+            "context_type": "question",
+            "sentiment_score": 0.2,
+            "engagement_score": 0.8
+        },
+        "proactive_actions": [
+            {
+                "action_type": "ask_followup",
+                "priority": 0.8,
+                "content": "What's your team size?",
+                "reasoning": "Helps recommend appropriate plan"
             }
-        }
+        ],
+        "should_ask_followup": True,
+        "followup_questions": ["What's your team size?", "What features are most important to you?"],
+        "suggested_topics": ["feature_comparison", "implementation_support"],
+        "confidence_score": 0.85
+    }
 
 
 class DecisionResponse(BaseModel):
@@ -221,27 +306,6 @@ class DecisionResponse(BaseModel):
     suggested_topics: List[str] = Field(default_factory=list, description="Suggested conversation topics")
     confidence_score: float = Field(..., description="Confidence in decision analysis", ge=0.0, le=1.0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "enhanced_response": "We offer three pricing plans tailored to different needs. Would you like me to explain which plan might work best for your specific requirements?",
-                "conversation_context": {
-                    "message_count": 2,
-                    "context_type": "question",
-                    "sentiment_score": 0.2,
-                    "engagement_score": 0.8
-                },
-                "proactive_actions": [
-                    {
-                        "action_type": "ask_followup",
-                        "priority": 0.8,
-                        "content": "What's your team size?",
-                        "reasoning": "Helps recommend appropriate plan"
-                    }
-                ],
-                "should_ask_followup": True,
-                "followup_questions": ["What's your team size?", "What features are most important to you?"],
-                "suggested_topics": ["feature_comparison", "implementation_support"],
-                "confidence_score": 0.85
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        json_schema_extra=_decision_response_schema_extra
+    )
\ No newline at end of file
@@ -1,10 +1,13 @@
 """
 Enhanced Pydantic models for sophisticated lead qualification and data collection.
 """
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+import sys
+from typing import List, Literal, Optional, Dict, Any, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from typing_extensions import NotRequired, TypedDict
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
+import time
 
 
 class CollectionStrategy(str, Enum):
@@ -13,6 +16,8 @@ class CollectionStrategy(str, Enum):
     CONVERSATIONAL = "conversational"
     PROGRESSIVE = "progressive"
 
+CollectionStrategyValue = Literal["direct", "conversational", "progressive"]
+
 
 class QualificationStage(str, Enum):
     """Lead qualification stages."""
@@ -24,6 +29,16 @@ class QualificationStage(str, Enum):
     QUALIFIED = "qualified"
     DISQUALIFIED = "disqualified"
 
+QualificationStageValue = Literal[
+    "initial_interest",
+    "need_assessment",
+    "budget_qualification",
+    "authority_verification",
+    "timeline_discussion",
+    "qualified",
+    "disqualified",
+]
+
 
 class LeadPriority(str, Enum):
     """Lead priority levels."""
@@ -32,6 +47,8 @@ class LeadPriority(str, Enum):
     HIGH = "high"
     URGENT = "urgent"
 
+LeadPriorityValue = Literal["low", "medium", "high", "urgent"]
+
 
 class LeadStatus(str, Enum):
     """Lead status tracking."""
@@ -43,6 +60,16 @@ class LeadStatus(str, Enum):
     CLOSED_WON = "closed_won"
     CLOSED_LOST = "closed_lost"
 
+LeadStatusValue = Literal[
+    "new",
+    "contacted",
+    "qualified",
+    "proposal_sent",
+    "negotiation",
+    "closed_won",
+    "closed_lost",
+]
+
 
 class ContactInfo(BaseModel):
     """Contact information for leads."""
@@ -54,6 +81,8 @@ class ContactInfo(BaseModel):
     linkedin_url: Optional[str] = Field(None, description="Lead's LinkedIn profile")
     website: Optional[str] = Field(None, description="Company website")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class QualificationData(BaseModel):
     """BANT qualification data."""
@@ -80,13 +109,15 @@ class ConversationMetrics(BaseModel):
 
 class LeadSignals(BaseModel):
     """Detected lead qualification signals."""
-    buying_intent_keywords: List[str] = Field(default_factory=list)
-    urgency_indicators: List[str] = Field(default_factory=list)
-    budget_mentions: List[str] = Field(default_factory=list)
-    authority_indicators: List[str] = Field(default_factory=list)
-    competitor_mentions: List[str] = Field(default_factory=list)
-    pain_point_expressions: List[str] = Field(default_factory=list)
-    timeline_mentions: List[str] = Field(default_factory=list)
+    buying_intent_keywords: Tuple[str, ...] = Field(default=())
+    urgency_indicators: Tuple[str, ...] = Field(default=())
+    budget_mentions: Tuple[str, ...] = Field(default=())
+    authority_indicators: Tuple[str, ...] = Field(default=())
+    competitor_mentions: Tuple[str, ...] = Field(default=())
+    pain_point_expressions: Tuple[str, ...] = Field(default=())
+    timeline_mentions: Tuple[str, ...] = Field(default=())
+
+    model_config = ConfigDict(frozen=True)
 
 
 class QualificationQuestion(BaseModel):
@@ -97,18 +128,31 @@ class QualificationQuestion(BaseModel):
     context: str = Field(..., description="Context for when to ask this question")
     follow_up_questions: List[str] = Field(default_factory=list)
 
+    model_config = ConfigDict(frozen=True)
+
+    @field_validator('category')
+    @classmethod
+    def intern_category(cls, v):
+        """Intern the BANT category, which comes from a small fixed vocabulary."""
+        return sys.intern(v)
+
 
 class LeadAnalysis(BaseModel):
     """Complete lead analysis results."""
     is_potential_lead: bool = Field(False, description="Whether this appears to be a lead")
     confidence_score: float = Field(0.0, ge=0.0, le=1.0, description="Confidence in lead assessment")
-    qualification_stage: QualificationStage = Field(QualificationStage.INITIAL_INTEREST)
+    qualification_stage: QualificationStageValue = Field("initial_interest")
     lead_signals: LeadSignals = Field(default_factory=LeadSignals)
     suggested_questions: List[QualificationQuestion] = Field(default_factory=list)
     next_actions: List[str] = Field(default_factory=list)
     risk_factors: List[str] = Field(default_factory=list)
 
 
+def _epoch_ms() -> int:
+    """Current time in epoch milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
 class EnhancedLeadData(BaseModel):
     """Complete enhanced lead data model."""
     id: Optional[str] = Field(None, description="Lead ID")
@@ -121,41 +165,70 @@ class EnhancedLeadData(BaseModel):
     conversation_metrics: ConversationMetrics = Field(default_factory=ConversationMetrics)
     
     # Lead management
-    collection_strategy: CollectionStrategy = Field(CollectionStrategy.CONVERSATIONAL)
+    collection_strategy: CollectionStrategyValue = Field("conversational")
     lead_score: float = Field(0.0, ge=0.0, le=100.0, description="Lead score (0-100)")
-    priority: LeadPriority = Field(LeadPriority.LOW)
-    status: LeadStatus = Field(LeadStatus.NEW)
-    qualification_stage: QualificationStage = Field(QualificationStage.INITIAL_INTEREST)
+    priority: LeadPriorityValue = Field("low")
+    status: LeadStatusValue = Field("new")
+    qualification_stage: QualificationStageValue = Field("initial_interest")
     
     # Analysis results
     lead_analysis: Optional[LeadAnalysis] = Field(None)
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-    last_interaction: Optional[datetime] = Field(None)
+    # Timestamps are epoch milliseconds in memory and ISO 8601 UTC on the wire
+    created_at: int = Field(default_factory=_epoch_ms)
+    updated_at: int = Field(default_factory=_epoch_ms)
+    last_interaction: Optional[int] = Field(None)
     
     # Additional context
     source: str = Field("chatbot", description="Lead source")
     tags: List[str] = Field(default_factory=list)
     notes: List[str] = Field(default_factory=list)
     
-    @validator('lead_score')
+    @field_validator('lead_score')
+    @classmethod
     def validate_lead_score(cls, v):
         """Ensure lead score is within valid range."""
         return max(0.0, min(100.0, v))
     
-    @validator('updated_at', always=True)
-    def set_updated_at(cls, v):
-        """Always update the timestamp when model is modified."""
-        return datetime.utcnow()
+    @field_validator('source')
+    @classmethod
+    def intern_source(cls, v):
+        """Intern the lead source, which is the same for most leads."""
+        return sys.intern(v)
+    
+    @field_validator('created_at', 'updated_at', 'last_interaction', mode='before')
+    @classmethod
+    def coerce_timestamp(cls, v):
+        """Accept datetimes and ISO 8601 strings and store them as epoch milliseconds."""
+        if isinstance(v, str):
+            try:
+                v = datetime.fromisoformat(v)
+            except ValueError:
+                return v
+        if isinstance(v, datetime):
+            if v.tzinfo is None:
+                v = v.replace(tzinfo=timezone.utc)
+            return int(v.timestamp() * 1000)
+        return v
+    
+    @field_serializer('created_at', 'updated_at', 'last_interaction')
+    def serialize_timestamp(self, timestamp: Optional[int]) -> Optional[str]:
+        """Render the millisecond timestamp as an ISO 8601 UTC string."""
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).isoformat()
+    
+    def touch(self) -> None:
+        """Bump updated_at to the current time after modifying the lead."""
+        self.updated_at = _epoch_ms()
 
 
 class LeadCollectionRequest(BaseModel):
     """Request for collecting lead data during conversation."""
     conversation_id: str = Field(..., description="Conversation ID")
     message: str = Field(..., description="User message to analyze")
-    collection_strategy: CollectionStrategy = Field(CollectionStrategy.CONVERSATIONAL)
+    collection_strategy: CollectionStrategyValue = Field("conversational")
     force_collection: bool = Field(False, description="Force data collection even if not natural")
 
 
@@ -165,13 +238,22 @@ class LeadCollectionResponse(BaseModel):
     collection_questions: List[QualificationQuestion] = Field(default_factory=list)
     should_ask_questions: bool = Field(False)
     collection_complete: bool = Field(False)
-    next_collection_strategy: Optional[CollectionStrategy] = Field(None)
+    next_collection_strategy: Optional[CollectionStrategyValue] = Field(None)
+
+    model_config = ConfigDict(extra='forbid')
+
+
+class LeadConversationMessage(TypedDict):
+    """Single message in a lead qualification conversation history."""
+    role: str
+    content: str
+    timestamp: NotRequired[Optional[str]]
 
 
 class LeadQualificationRequest(BaseModel):
     """Request for lead qualification analysis."""
     conversation_id: str = Field(..., description="Conversation ID")
-    conversation_history: List[Dict[str, Any]] = Field(..., description="Full conversation history")
+    conversation_history: List[LeadConversationMessage] = Field(..., description="Full conversation history")
     existing_lead_data: Optional[EnhancedLeadData] = Field(None)
 
 
@@ -183,6 +265,8 @@ class LeadQualificationResponse(BaseModel):
     should_escalate: bool = Field(False, description="Whether to escalate to human")
     escalation_reason: Optional[str] = Field(None)
 
+    model_config = ConfigDict(extra='forbid')
+
 
 class LeadScoringFactors(BaseModel):
     """Factors used in lead scoring calculation."""
@@ -213,4 +297,6 @@ class BulkLeadAnalysisResponse(BaseModel):
     leads_identified: int = Field(0)
     leads_data: List[EnhancedLeadData] = Field(default_factory=list)
     analysis_summary: Dict[str, Any] = Field(default_factory=dict)
-    processing_time: float = Field(0.0)
\ No newline at end of file
+    processing_time: float = Field(0.0)
+
+    model_config = ConfigDict(extra='forbid')
\ No newline at end of file
@@ -1,12 +1,16 @@
 """
 Enhanced streaming models for intelligent chatbot responses.
 """
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+import sys
+from typing import List, Literal, Optional, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 from app.models.decision import ProactiveAction, ConversationIntelligence
 
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
 
 class StreamResponseType(str, Enum):
     """Types of streaming response chunks."""
@@ -20,6 +24,29 @@ class StreamResponseType(str, Enum):
     ERROR = "error"
     DONE = "done"
 
+StreamResponseTypeValue = Literal[
+    "token",
+    "metadata",
+    "proactive_question",
+    "suggested_topic",
+    "conversation_action",
+    "intelligence_metadata",
+    "fallback_strategy",
+    "error",
+    "done",
+]
+
+
+def _fallback_strategy_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the FallbackStrategy example to its JSON schema."""
+    schema["example"] = {
+        "strategy_type": "related_information",
+        "content": "While I don't have specific information about that topic, I can help you with related areas like...",
+        "reasoning": "No direct match found, providing related context",
+        "alternative_suggestions": ["Check our documentation", "Contact support"],
+        "escalation_offered": True
+    }
+
 
 class FallbackStrategy(BaseModel):
     """Model for fallback response strategies when knowledge gaps exist."""
@@ -29,21 +56,32 @@ class FallbackStrategy(BaseModel):
     alternative_suggestions: List[str] = Field(default_factory=list, description="Alternative suggestions")
     escalation_offered: bool = Field(default=False, description="Whether escalation was offered")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "strategy_type": "related_information",
-                "content": "While I don't have specific information about that topic, I can help you with related areas like...",
-                "reasoning": "No direct match found, providing related context",
-                "alternative_suggestions": ["Check our documentation", "Contact support"],
-                "escalation_offered": True
-            }
+    @field_validator('strategy_type')
+    @classmethod
+    def intern_strategy_type(cls, v):
+        """Intern the strategy type, which comes from a small fixed vocabulary."""
+        return sys.intern(v)
+    
+    model_config = ConfigDict(
+        json_schema_extra=_fallback_strategy_schema_extra
+    )
+
+
+def _enhanced_stream_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the EnhancedStreamResponse example to its JSON schema."""
+    schema["example"] = {
+        "type": "token",
+        "content": "Based on your requirements, ",
+        "metadata": {
+            "token_index": 5,
+            "confidence": 0.85
         }
+    }
 
 
 class EnhancedStreamResponse(BaseModel):
     """Enhanced streaming response model with intelligent features."""
-    type: StreamResponseType = Field(..., description="Type of streaming chunk")
+    type: StreamResponseTypeValue = Field(..., description="Type of streaming chunk")
     content: Optional[str] = Field(None, description="Content for token streaming")
     proactive_question: Optional[str] = Field(None, description="Proactive follow-up question")
     suggested_topic: Optional[str] = Field(None, description="Suggested conversation topic")
@@ -52,27 +90,26 @@ class EnhancedStreamResponse(BaseModel):
     fallback_strategy: Optional[FallbackStrategy] = Field(None, description="Fallback strategy for knowledge gaps")
     error_message: Optional[str] = Field(None, description="Error message if type is error")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+
+    @classmethod
+    def token(cls, content: str, metadata: Optional[Dict[str, Any]] = None) -> "EnhancedStreamResponse":
+        """Build a token chunk from trusted service output without running validation."""
+        return cls.model_construct(type="token", content=content, metadata=metadata)
+
+    def to_sse_bytes(self) -> bytes:
+        """Encode this chunk as a Server-Sent Events frame, omitting unset fields."""
+        return SSE_PREFIX + self.model_dump_json(exclude_none=True).encode() + SSE_SUFFIX
     
-    # Remove the validator for now to avoid field ordering issues
-    # The validation will be handled at the service level instead
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "type": "token",
-                "content": "Based on your requirements, ",
-                "metadata": {
-                    "token_index": 5,
-                    "confidence": 0.85
-                }
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra=_enhanced_stream_response_schema_extra
+    )
 
 
-class EnhancedStreamRequest(BaseModel):
-    """Enhanced streaming request model."""
+class _EnhancedStreamRequestBase(BaseModel):
+    """Fields and validation shared by the enhanced streaming request models."""
     message: str = Field(..., description="User's chat message", min_length=1, max_length=2000)
-    user_id: Optional[str] = Field(None, description="User ID (will be overridden by API key validation)")
     chatbot_id: Optional[str] = Field(None, description="Chatbot ID for multi-chatbot support")
     conversation_id: Optional[str] = Field(None, description="Conversation ID for context")
     user_email: Optional[str] = Field(None, description="External user email for session management")
@@ -87,69 +124,69 @@ class EnhancedStreamRequest(BaseModel):
     enable_fallback_strategies: bool = Field(default=True, description="Enable fallback strategy streaming")
     avoid_i_dont_know: bool = Field(default=True, description="Avoid 'I don't know' responses")
     
-    @validator('message')
-    def validate_message(cls, v):
-        """Validate message content."""
-        if not v or not v.strip():
-            raise ValueError('Message cannot be empty')
-        return v.strip()
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+def _enhanced_stream_request_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the EnhancedStreamRequest example to its JSON schema."""
+    schema["example"] = {
+        "message": "What are your pricing plans?",
+        "conversation_id": "conv_123",
+        "enable_proactive_questions": True,
+        "enable_topic_suggestions": True,
+        "enable_conversation_actions": True,
+        "avoid_i_dont_know": True
+    }
+
+
+class EnhancedStreamRequest(_EnhancedStreamRequestBase):
+    """Enhanced streaming request model."""
+    user_id: Optional[str] = Field(None, description="User ID (will be overridden by API key validation)")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "message": "What are your pricing plans?",
-                "conversation_id": "conv_123",
-                "enable_proactive_questions": True,
-                "enable_topic_suggestions": True,
-                "enable_conversation_actions": True,
-                "avoid_i_dont_know": True
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_enhanced_stream_request_schema_extra
+    )
 
 
-class EnhancedStreamRequestWithApiKey(BaseModel):
+def _enhanced_stream_request_with_api_key_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the EnhancedStreamRequestWithApiKey example to its JSON schema."""
+    schema["example"] = {
+        "message": "What are your pricing plans?",
+        "api_key": "sk-1234567890abcdef",
+        "conversation_id": "conv_123",
+        "enable_proactive_questions": True,
+        "enable_topic_suggestions": True,
+        "avoid_i_dont_know": True
+    }
+
+
+class EnhancedStreamRequestWithApiKey(_EnhancedStreamRequestBase):
     """Enhanced streaming request model with API key authentication."""
-    message: str = Field(..., description="User's chat message", min_length=1, max_length=2000)
     api_key: str = Field(..., description="User's API key for authentication", min_length=1)
     chatbot_id: Optional[str] = Field(None, description="Chatbot ID for widget requests")
-    conversation_id: Optional[str] = Field(None, description="Conversation ID for context")
-    user_email: Optional[str] = Field(None, description="External user email for session management")
-    session_id: Optional[str] = Field(None, description="Session ID for memory persistence")
-    image_url: Optional[str] = Field(None, description="URL of uploaded image for analysis")
     
-    # Enhanced streaming options
-    enable_proactive_questions: bool = Field(default=True, description="Enable proactive question streaming")
-    enable_topic_suggestions: bool = Field(default=True, description="Enable topic suggestion streaming")
-    enable_conversation_actions: bool = Field(default=True, description="Enable conversation action streaming")
-    enable_intelligence_metadata: bool = Field(default=True, description="Enable intelligence metadata streaming")
-    enable_fallback_strategies: bool = Field(default=True, description="Enable fallback strategy streaming")
-    avoid_i_dont_know: bool = Field(default=True, description="Avoid 'I don't know' responses")
-    
-    @validator('message')
-    def validate_message(cls, v):
-        """Validate message content."""
-        if not v or not v.strip():
-            raise ValueError('Message cannot be empty')
-        return v.strip()
-    
-    @validator('api_key')
+    @field_validator('api_key')
+    @classmethod
     def validate_api_key(cls, v):
         """Validate API key format."""
         if not v or not v.strip():
             raise ValueError('API key cannot be empty')
         return v.strip()
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "message": "What are your pricing plans?",
-                "api_key": "sk-1234567890abcdef",
-                "conversation_id": "conv_123",
-                "enable_proactive_questions": True,
-                "enable_topic_suggestions": True,
-                "avoid_i_dont_know": True
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_enhanced_stream_request_with_api_key_schema_extra
+    )
+
+
+def _streaming_config_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the StreamingConfig example to its JSON schema."""
+    schema["example"] = {
+        "chunk_size": 1,
+        "delay_ms": 50,
+        "include_metadata": True,
+        "enable_typing_indicator": True,
+        "max_response_tokens": 2000
+    }
 
 
 class StreamingConfig(BaseModel):
@@ -160,13 +197,6 @@ class StreamingConfig(BaseModel):
     enable_typing_indicator: bool = Field(default=True, description="Enable typing indicator")
     max_response_tokens: int = Field(default=2000, description="Maximum tokens in response", ge=100, le=4000)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "chunk_size": 1,
-                "delay_ms": 50,
-                "include_metadata": True,
-                "enable_typing_indicator": True,
-                "max_response_tokens": 2000
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        json_schema_extra=_streaming_config_schema_extra
+    )
\ No newline at end of file
@@ -2,7 +2,8 @@
 Escalation management models for conversation escalation system.
 """
 
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
@@ -41,6 +42,14 @@ class EscalationTrigger(BaseModel):
     reason: str
     context: Dict[str, Any] = Field(default_factory=dict)
 
+    model_config = ConfigDict(frozen=True)
+
+    @field_validator('trigger_type')
+    @classmethod
+    def intern_trigger_type(cls, v):
+        """Intern the trigger type, which comes from a small fixed vocabulary."""
+        return sys.intern(v)
+
 
 class EscalationSignals(BaseModel):
     """Collection of escalation signals detected in conversation."""
@@ -61,6 +70,8 @@ class EscalationResponse(BaseModel):
     agent_context: Dict[str, Any] = Field(default_factory=dict)
     should_escalate: bool = True
 
+    model_config = ConfigDict(extra='forbid')
+
 
 class EscalationRequest(BaseModel):
     """Escalation request data model."""
@@ -119,13 +130,42 @@ class ConversationContext(BaseModel):
 class EscalationMetrics(BaseModel):
     """Metrics for escalation monitoring."""
     total_escalations: int
-    escalations_by_type: Dict[EscalationType, int]
-    escalations_by_urgency: Dict[UrgencyLevel, int]
+    # One counter per EscalationType member
+    technical_count: int = 0
+    frustration_count: int = 0
+    complexity_count: int = 0
+    complaint_count: int = 0
+    request_count: int = 0
+    # One counter per UrgencyLevel member
+    low_count: int = 0
+    medium_count: int = 0
+    high_count: int = 0
+    critical_count: int = 0
     average_resolution_time: Optional[float] = None  # hours
     resolution_rate: float = Field(..., ge=0.0, le=1.0)
     customer_satisfaction: Optional[float] = Field(None, ge=0.0, le=1.0)
     agent_response_time: Optional[float] = None  # minutes
 
+    def by_type(self, escalation_type: EscalationType) -> int:
+        """Return the counter for an escalation type."""
+        return getattr(self, f"{EscalationType(escalation_type).value.lower()}_count")
+
+    def by_urgency(self, urgency_level: UrgencyLevel) -> int:
+        """Return the counter for an urgency level."""
+        return getattr(self, f"{UrgencyLevel(urgency_level).value.lower()}_count")
+
+    @computed_field
+    @property
+    def escalations_by_type(self) -> Dict[EscalationType, int]:
+        """Per-type counts in the original mapping shape."""
+        return {escalation_type: self.by_type(escalation_type) for escalation_type in EscalationType}
+
+    @computed_field
+    @property
+    def escalations_by_urgency(self) -> Dict[UrgencyLevel, int]:
+        """Per-urgency counts in the original mapping shape."""
+        return {urgency_level: self.by_urgency(urgency_level) for urgency_level in UrgencyLevel}
+
 
 class AgentNotification(BaseModel):
     """Notification to human agents."""
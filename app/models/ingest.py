@@ -1,8 +1,11 @@
 """
 Pydantic models for document ingestion endpoints.
 """
+import re
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_URL_RE = re.compile(r'https?://\S+')
 
 
 class IngestRequest(BaseModel):
@@ -10,23 +13,23 @@ class IngestRequest(BaseModel):
     user_id: str = Field(..., description="User ID for document association", min_length=1)
     urls: Optional[List[str]] = Field(None, description="List of URLs to process")
     
-    @validator('urls')
+    @field_validator('urls')
+    @classmethod
     def validate_urls(cls, v):
         """Validate URL format."""
         if v is not None:
-            if not isinstance(v, list):
-                raise ValueError('URLs must be a list')
             if len(v) == 0:
                 raise ValueError('URLs list cannot be empty if provided')
-            for url in v:
-                if not isinstance(url, str) or not url.strip():
+            # Basic URL validation, one regex match per URL
+            bad_url = next((url for url in v if not _URL_RE.fullmatch(url)), None)
+            if bad_url is not None:
+                if not bad_url.strip():
                     raise ValueError('Each URL must be a non-empty string')
-                # Basic URL validation
-                if not (url.startswith('http://') or url.startswith('https://')):
-                    raise ValueError(f'Invalid URL format: {url}')
+                raise ValueError(f'Invalid URL format: {bad_url}')
         return v
     
-    @validator('user_id')
+    @field_validator('user_id')
+    @classmethod
     def validate_user_id(cls, v):
         """Validate user ID format."""
         if not v or not v.strip():
@@ -34,6 +37,26 @@ class IngestRequest(BaseModel):
         return v.strip()
 
 
+def _ingest_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the IngestResponse example to its JSON schema."""
+    schema["example"] = {
+        "success": True,
+        "message": "Successfully processed 3 documents into 15 chunks",
+        "documents_processed": 3,
+        "processing_stats": {
+            "total_documents": 3,
+            "total_chunks": 15,
+            "source_types": {"url": 1, "pdf": 1, "docx": 1},
+            "avg_chunk_size": 850
+        },
+        "vector_storage_stats": {
+            "total_documents": 15,
+            "unique_sources": 3,
+            "avg_content_length": 850.5
+        }
+    }
+
+
 class IngestResponse(BaseModel):
     """Response model for document ingestion with detailed information."""
     success: bool = Field(..., description="Whether the ingestion was successful")
@@ -42,25 +65,10 @@ class IngestResponse(BaseModel):
     processing_stats: Optional[Dict[str, Any]] = Field(None, description="Detailed processing statistics")
     vector_storage_stats: Optional[Dict[str, Any]] = Field(None, description="Vector storage statistics")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Successfully processed 3 documents into 15 chunks",
-                "documents_processed": 3,
-                "processing_stats": {
-                    "total_documents": 3,
-                    "total_chunks": 15,
-                    "source_types": {"url": 1, "pdf": 1, "docx": 1},
-                    "avg_chunk_size": 850
-                },
-                "vector_storage_stats": {
-                    "total_documents": 15,
-                    "unique_sources": 3,
-                    "avg_content_length": 850.5
-                }
-            }
-        }
+    model_config = ConfigDict(
+        extra='forbid',
+        json_schema_extra=_ingest_response_schema_extra
+    )
 
 
 class ProcessingStats(BaseModel):
@@ -1,8 +1,8 @@
 """
 Pydantic models for training instruction endpoints.
 """
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import List, Literal, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from enum import Enum
 from datetime import datetime
 
@@ -14,66 +14,54 @@ class InstructionType(str, Enum):
     TONE = "tone"
     ESCALATION = "escalation"
 
+InstructionTypeValue = Literal["behavior", "knowledge", "tone", "escalation"]
+
 
 class TrainingInstructionCreate(BaseModel):
     """Request model for creating training instructions."""
     chatbot_id: str = Field(..., description="Chatbot ID for instruction association", min_length=1)
-    type: InstructionType = Field(..., description="Type of instruction")
+    type: InstructionTypeValue = Field(..., description="Type of instruction")
     title: str = Field(..., description="Title of the instruction", min_length=1, max_length=255)
     content: str = Field(..., description="Content of the instruction", min_length=1)
     priority: int = Field(1, description="Priority level (1-10, higher is more important)", ge=1, le=10)
     is_active: bool = Field(True, description="Whether the instruction is active")
     
-    @validator('title')
-    def validate_title(cls, v):
-        """Validate title format."""
-        if not v or not v.strip():
-            raise ValueError('Title cannot be empty')
-        return v.strip()
-    
-    @validator('content')
-    def validate_content(cls, v):
-        """Validate content format."""
-        if not v or not v.strip():
-            raise ValueError('Content cannot be empty')
-        return v.strip()
-    
-    @validator('chatbot_id')
-    def validate_chatbot_id(cls, v):
-        """Validate chatbot ID format."""
-        if not v or not v.strip():
-            raise ValueError('Chatbot ID cannot be empty')
-        return v.strip()
+    model_config = ConfigDict(str_strip_whitespace=True)
 
 
 class TrainingInstructionUpdate(BaseModel):
     """Request model for updating training instructions."""
-    type: Optional[InstructionType] = Field(None, description="Type of instruction")
+    type: Optional[InstructionTypeValue] = Field(None, description="Type of instruction")
     title: Optional[str] = Field(None, description="Title of the instruction", min_length=1, max_length=255)
     content: Optional[str] = Field(None, description="Content of the instruction", min_length=1)
     priority: Optional[int] = Field(None, description="Priority level (1-10)", ge=1, le=10)
     is_active: Optional[bool] = Field(None, description="Whether the instruction is active")
     
-    @validator('title')
-    def validate_title(cls, v):
-        """Validate title format."""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('Title cannot be empty')
-        return v.strip() if v else v
-    
-    @validator('content')
-    def validate_content(cls, v):
-        """Validate content format."""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('Content cannot be empty')
-        return v.strip() if v else v
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+def _training_instruction_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the TrainingInstructionResponse example to its JSON schema."""
+    schema["example"] = {
+        "id": "cm123abc456def",
+        "chatbot_id": "cm789xyz123abc",
+        "type": "behavior",
+        "title": "Customer Service Tone",
+        "content": "Always respond in a friendly, professional manner. Use empathetic language and offer solutions.",
+        "priority": 5,
+        "is_active": True,
+        "created_at": "2024-01-15T10:30:00Z",
+        "updated_at": "2024-01-15T10:30:00Z",
+        "embedding": None,
+        "embedding_length": None
+    }
 
 
 class TrainingInstructionResponse(BaseModel):
     """Response model for training instructions."""
     id: str = Field(..., description="Unique identifier for the instruction")
     chatbot_id: str = Field(..., description="Chatbot ID")
-    type: InstructionType = Field(..., description="Type of instruction")
+    type: InstructionTypeValue = Field(..., description="Type of instruction")
     title: str = Field(..., description="Title of the instruction")
     content: str = Field(..., description="Content of the instruction")
     priority: int = Field(..., description="Priority level")
@@ -83,23 +71,44 @@ class TrainingInstructionResponse(BaseModel):
     # Optional debug fields for embedding information
     embedding: Optional[List[float]] = Field(None, description="Embedding vector (for debugging)")
     embedding_length: Optional[int] = Field(None, description="Length of embedding vector (for debugging)")
+
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "TrainingInstructionResponse":
+        """Build from already-validated values without running validation."""
+        return cls.model_construct(**data)
     
-    class Config:
-        schema_extra = {
-            "example": {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra=_training_instruction_response_schema_extra
+    )
+
+
+def _instruction_list_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the InstructionListResponse example to its JSON schema."""
+    schema["example"] = {
+        "instructions": [
+            {
                 "id": "cm123abc456def",
                 "chatbot_id": "cm789xyz123abc",
                 "type": "behavior",
                 "title": "Customer Service Tone",
-                "content": "Always respond in a friendly, professional manner. Use empathetic language and offer solutions.",
+                "content": "Always respond in a friendly, professional manner.",
                 "priority": 5,
                 "is_active": True,
                 "created_at": "2024-01-15T10:30:00Z",
-                "updated_at": "2024-01-15T10:30:00Z",
-                "embedding": None,
-                "embedding_length": None
+                "updated_at": "2024-01-15T10:30:00Z"
             }
+        ],
+        "total_count": 1,
+        "active_count": 1,
+        "type_breakdown": {
+            "behavior": 1,
+            "knowledge": 0,
+            "tone": 0,
+            "escalation": 0
         }
+    }
 
 
 class InstructionListResponse(BaseModel):
@@ -109,48 +118,31 @@ class InstructionListResponse(BaseModel):
     active_count: int = Field(..., description="Number of active instructions", ge=0)
     type_breakdown: Dict[str, int] = Field(..., description="Breakdown by instruction type")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "instructions": [
-                    {
-                        "id": "cm123abc456def",
-                        "chatbot_id": "cm789xyz123abc",
-                        "type": "behavior",
-                        "title": "Customer Service Tone",
-                        "content": "Always respond in a friendly, professional manner.",
-                        "priority": 5,
-                        "is_active": True,
-                        "created_at": "2024-01-15T10:30:00Z",
-                        "updated_at": "2024-01-15T10:30:00Z"
-                    }
-                ],
-                "total_count": 1,
-                "active_count": 1,
-                "type_breakdown": {
-                    "behavior": 1,
-                    "knowledge": 0,
-                    "tone": 0,
-                    "escalation": 0
-                }
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra=_instruction_list_response_schema_extra
+    )
 
 
 class InstructionBulkImportRequest(BaseModel):
     """Request model for bulk importing instructions."""
     chatbot_id: str = Field(..., description="Chatbot ID for instruction association")
-    instructions: List[TrainingInstructionCreate] = Field(..., description="List of instructions to import")
+    # Between 1 and 100 instructions; 100 is a reasonable limit for bulk import
+    instructions: List[TrainingInstructionCreate] = Field(..., description="List of instructions to import", min_length=1, max_length=100)
     replace_existing: bool = Field(False, description="Whether to replace existing instructions")
-    
-    @validator('instructions')
-    def validate_instructions(cls, v):
-        """Validate instructions list."""
-        if not v or len(v) == 0:
-            raise ValueError('At least one instruction must be provided')
-        if len(v) > 100:  # Reasonable limit for bulk import
-            raise ValueError('Cannot import more than 100 instructions at once')
-        return v
+
+
+def _instruction_bulk_import_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the InstructionBulkImportResponse example to its JSON schema."""
+    schema["example"] = {
+        "success": True,
+        "message": "Successfully imported 5 instructions",
+        "imported_count": 5,
+        "skipped_count": 0,
+        "error_count": 0,
+        "errors": []
+    }
 
 
 class InstructionBulkImportResponse(BaseModel):
@@ -162,17 +154,11 @@ class InstructionBulkImportResponse(BaseModel):
     error_count: int = Field(..., description="Number of instructions that failed", ge=0)
     errors: List[str] = Field([], description="List of error messages for failed imports")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Successfully imported 5 instructions",
-                "imported_count": 5,
-                "skipped_count": 0,
-                "error_count": 0,
-                "errors": []
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra=_instruction_bulk_import_response_schema_extra
+    )
 
 
 class InstructionTestRequest(BaseModel):
@@ -180,12 +166,19 @@ class InstructionTestRequest(BaseModel):
     instruction_id: str = Field(..., description="ID of the instruction to test")
     test_query: str = Field(..., description="Test query to evaluate against the instruction", min_length=1)
     
-    @validator('test_query')
-    def validate_test_query(cls, v):
-        """Validate test query format."""
-        if not v or not v.strip():
-            raise ValueError('Test query cannot be empty')
-        return v.strip()
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+def _instruction_test_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the InstructionTestResponse example to its JSON schema."""
+    schema["example"] = {
+        "instruction_id": "cm123abc456def",
+        "test_query": "How should I handle angry customers?",
+        "relevance_score": 0.85,
+        "similarity_score": 0.78,
+        "would_be_retrieved": True,
+        "explanation": "This instruction is highly relevant for customer service scenarios involving frustrated customers."
+    }
 
 
 class InstructionTestResponse(BaseModel):
@@ -197,39 +190,41 @@ class InstructionTestResponse(BaseModel):
     would_be_retrieved: bool = Field(..., description="Whether this instruction would be retrieved for the query")
     explanation: str = Field(..., description="Explanation of the test results")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "instruction_id": "cm123abc456def",
-                "test_query": "How should I handle angry customers?",
-                "relevance_score": 0.85,
-                "similarity_score": 0.78,
-                "would_be_retrieved": True,
-                "explanation": "This instruction is highly relevant for customer service scenarios involving frustrated customers."
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra=_instruction_test_response_schema_extra
+    )
 
 
 class EnhancedTrainRequest(BaseModel):
     """Enhanced training request that includes both documents and instructions."""
-    chatbot_id: str = Field(..., description="Chatbot ID for training association")
+    chatbot_id: str = Field(..., description="Chatbot ID for training association", min_length=1)
     documents: Optional[List[str]] = Field(None, description="List of document URLs to process")
     instructions: Optional[List[TrainingInstructionCreate]] = Field(None, description="List of custom instructions")
     replace_existing: bool = Field(False, description="Whether to replace existing training data")
     instruction_types: Optional[List[InstructionType]] = Field(None, description="Types of instructions to include")
     
-    @validator('chatbot_id')
-    def validate_chatbot_id(cls, v):
-        """Validate chatbot ID format."""
-        if not v or not v.strip():
-            raise ValueError('Chatbot ID cannot be empty')
-        return v.strip()
+    model_config = ConfigDict(str_strip_whitespace=True)
     
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Validate that at least one training source is provided
+    @model_validator(mode='after')
+    def validate_training_sources(self):
+        """Validate that at least one training source is provided."""
         if not self.documents and not self.instructions:
             raise ValueError('At least one document URL or instruction must be provided')
+        return self
+
+
+def _enhanced_train_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the EnhancedTrainResponse example to its JSON schema."""
+    schema["example"] = {
+        "success": True,
+        "message": "Successfully processed 3 documents and 5 instructions",
+        "documents_processed": 3,
+        "instructions_processed": 5,
+        "embeddings_generated": 8,
+        "processing_time_ms": 2500.0
+    }
 
 
 class EnhancedTrainResponse(BaseModel):
@@ -241,14 +236,8 @@ class EnhancedTrainResponse(BaseModel):
     embeddings_generated: int = Field(..., description="Total embeddings generated", ge=0)
     processing_time_ms: float = Field(..., description="Total processing time in milliseconds", ge=0.0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Successfully processed 3 documents and 5 instructions",
-                "documents_processed": 3,
-                "instructions_processed": 5,
-                "embeddings_generated": 8,
-                "processing_time_ms": 2500.0
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra=_enhanced_train_response_schema_extra
+    )
\ No newline at end of file
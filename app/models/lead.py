@@ -1,11 +1,31 @@
 """
 Pydantic models for lead qualification and scoring.
 """
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+import re
+import time
+from typing import Annotated, List, Literal, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from enum import Enum
+from typing_extensions import TypedDict
 from datetime import datetime
 
+_NON_DIGIT = re.compile(r'\D')
+_CRM_MESSAGE_MAX_LENGTH = 500
+
+# (monotonic_ns, iso_string) of the last formatted timestamp
+_ts_cache = [0, ""]
+
+
+def _cached_iso_now() -> str:
+    """Current UTC time as ISO 8601, reused for up to 10ms across calls."""
+    now_ns = time.monotonic_ns()
+    if now_ns - _ts_cache[0] < 10_000_000:
+        return _ts_cache[1]
+    iso_now = datetime.utcnow().isoformat()
+    _ts_cache[0] = now_ns
+    _ts_cache[1] = iso_now
+    return iso_now
+
 
 class LeadPriority(str, Enum):
     """Lead priority levels."""
@@ -14,6 +34,8 @@ class LeadPriority(str, Enum):
     HIGH = "high"
     URGENT = "urgent"
 
+LeadPriorityValue = Literal["low", "medium", "high", "urgent"]
+
 
 class LeadType(str, Enum):
     """Types of leads based on detected intent."""
@@ -25,22 +47,28 @@ class LeadType(str, Enum):
     FEATURE_REQUEST = "feature_request"
     GENERAL_INQUIRY = "general_inquiry"
 
+LeadTypeValue = Literal[
+    "demo_request",
+    "enterprise_inquiry",
+    "bulk_order",
+    "pricing_inquiry",
+    "support_escalation",
+    "feature_request",
+    "general_inquiry",
+]
+
+
+# Sentiment score bounded to [-1.0, 1.0], checked per item by pydantic-core
+SentimentScore = Annotated[float, Field(ge=-1.0, le=1.0)]
+
 
 class ConversationContextRequest(BaseModel):
     """Request model for conversation context information."""
     message_count: int = Field(..., description="Number of messages in conversation", ge=0)
     conversation_length: int = Field(..., description="Total character length of conversation", ge=0)
     engagement_score: float = Field(0.5, description="Engagement score (0.0 to 1.0)", ge=0.0, le=1.0)
-    sentiment_history: List[float] = Field(default_factory=list, description="List of sentiment scores")
+    sentiment_history: List[SentimentScore] = Field(default_factory=list, description="List of sentiment scores")
     previous_intents: List[str] = Field(default_factory=list, description="Previously detected intents")
-    
-    @validator('sentiment_history')
-    def validate_sentiment_history(cls, v):
-        """Validate sentiment scores are in valid range."""
-        for score in v:
-            if not -1.0 <= score <= 1.0:
-                raise ValueError('Sentiment scores must be between -1.0 and 1.0')
-        return v
 
 
 class LeadAnalysisRequest(BaseModel):
@@ -48,58 +76,105 @@ class LeadAnalysisRequest(BaseModel):
     message: str = Field(..., description="Message to analyze for lead potential", min_length=1, max_length=2000)
     conversation_context: Optional[ConversationContextRequest] = Field(None, description="Optional conversation context")
     
-    @validator('message')
-    def validate_message(cls, v):
-        """Validate message content."""
-        if not v or not v.strip():
-            raise ValueError('Message cannot be empty')
-        return v.strip()
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+class ScoringFactors(TypedDict, total=False):
+    """Individual lead scoring factors, each between 0.0 and 1.0."""
+    intent_confidence: float
+    keyword_density: float
+    conversation_engagement: float
+    urgency_indicators: float
+    company_size: float
+    decision_maker: float
+    contact_completeness: float
+
+
+class ExtractedContactData(TypedDict, total=False):
+    """Contact details extracted from a message."""
+    email: str
+    phone: str
+    company: str
+    name: str
+
+
+def _lead_score_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the LeadScoreResponse example to its JSON schema."""
+    schema["example"] = {
+        "total_score": 0.75,
+        "priority": "high",
+        "lead_type": "demo_request",
+        "confidence": 0.82,
+        "should_qualify": True,
+        "factors": {
+            "intent_confidence": 0.9,
+            "keyword_density": 0.6,
+            "conversation_engagement": 0.7,
+            "urgency_indicators": 0.4,
+            "company_size": 0.8,
+            "decision_maker": 0.0,
+            "contact_completeness": 0.6
+        },
+        "extracted_data": {
+            "email": "john.doe@enterprise.com",
+            "name": "John Doe",
+            "company": "Enterprise Corp"
+        },
+        "crm_mapping": {
+            "lead_source": "chatbot",
+            "lead_score": 0.75,
+            "lead_priority": "high",
+            "demo_requested": True,
+            "follow_up_action": "schedule_demo"
+        },
+        "analyzed_at": "2024-01-15T10:30:00Z"
+    }
 
 
 class LeadScoreResponse(BaseModel):
     """Response model for lead scoring results."""
     total_score: float = Field(..., description="Total lead score (0.0 to 1.0)", ge=0.0, le=1.0)
-    priority: LeadPriority = Field(..., description="Lead priority level")
-    lead_type: LeadType = Field(..., description="Type of lead detected")
+    priority: LeadPriorityValue = Field(..., description="Lead priority level")
+    lead_type: LeadTypeValue = Field(..., description="Type of lead detected")
     confidence: float = Field(..., description="Confidence in scoring (0.0 to 1.0)", ge=0.0, le=1.0)
     should_qualify: bool = Field(..., description="Whether lead should trigger qualification workflow")
-    factors: Dict[str, float] = Field(..., description="Individual scoring factors")
-    extracted_data: Dict[str, Any] = Field(..., description="Extracted contact and company data")
+    factors: ScoringFactors = Field(..., description="Individual scoring factors")
+    extracted_data: ExtractedContactData = Field(..., description="Extracted contact and company data")
     crm_mapping: Dict[str, Any] = Field(..., description="CRM field mappings for lead creation")
     analyzed_at: str = Field(..., description="Analysis timestamp")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "total_score": 0.75,
-                "priority": "high",
-                "lead_type": "demo_request",
-                "confidence": 0.82,
-                "should_qualify": True,
-                "factors": {
-                    "intent_confidence": 0.9,
-                    "keyword_density": 0.6,
-                    "conversation_engagement": 0.7,
-                    "urgency_indicators": 0.4,
-                    "company_size": 0.8,
-                    "decision_maker": 0.0,
-                    "contact_completeness": 0.6
-                },
-                "extracted_data": {
-                    "email": "john.doe@enterprise.com",
-                    "name": "John Doe",
-                    "company": "Enterprise Corp"
-                },
-                "crm_mapping": {
-                    "lead_source": "chatbot",
-                    "lead_score": 0.75,
-                    "lead_priority": "high",
-                    "demo_requested": True,
-                    "follow_up_action": "schedule_demo"
-                },
-                "analyzed_at": "2024-01-15T10:30:00Z"
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra=_lead_score_response_schema_extra
+    )
+
+
+class LeadTriggerMetadata(TypedDict, total=False):
+    """Metadata attached to a lead qualification trigger."""
+    source: str
+    analysis_version: str
+    chatbot_id: str
+
+
+def _lead_qualification_trigger_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the LeadQualificationTrigger example to its JSON schema."""
+    schema["example"] = {
+        "trigger_id": "trig_123e4567-e89b-12d3-a456-426614174000",
+        "lead_score": {
+            "total_score": 0.75,
+            "priority": "high",
+            "lead_type": "demo_request"
+        },
+        "conversation_id": "conv_123e4567-e89b-12d3-a456-426614174000",
+        "user_email": "prospect@company.com",
+        "message_id": "msg_123e4567-e89b-12d3-a456-426614174000",
+        "trigger_type": "lead_qualification",
+        "metadata": {
+            "source": "chat_widget",
+            "chatbot_id": "bot_123"
+        },
+        "created_at": "2024-01-15T10:30:00Z"
+    }
 
 
 class LeadQualificationTrigger(BaseModel):
@@ -110,47 +185,62 @@ class LeadQualificationTrigger(BaseModel):
     user_email: Optional[str] = Field(None, description="User email if available")
     message_id: str = Field(..., description="Message that triggered qualification")
     trigger_type: str = Field("lead_qualification", description="Type of trigger")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional trigger metadata")
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat(), description="Trigger creation time")
+    metadata: LeadTriggerMetadata = Field(default_factory=dict, description="Additional trigger metadata")
+    created_at: str = Field(default_factory=_cached_iso_now, description="Trigger creation time")
+
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "LeadQualificationTrigger":
+        """Build from already-validated values without running validation."""
+        return cls.model_construct(**data)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "trigger_id": "trig_123e4567-e89b-12d3-a456-426614174000",
-                "lead_score": {
-                    "total_score": 0.75,
-                    "priority": "high",
-                    "lead_type": "demo_request"
-                },
-                "conversation_id": "conv_123e4567-e89b-12d3-a456-426614174000",
-                "user_email": "prospect@company.com",
-                "message_id": "msg_123e4567-e89b-12d3-a456-426614174000",
-                "trigger_type": "lead_qualification",
-                "metadata": {
-                    "source": "chat_widget",
-                    "chatbot_id": "bot_123"
-                },
-                "created_at": "2024-01-15T10:30:00Z"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_lead_qualification_trigger_schema_extra
+    )
+
+
+def _crm_lead_data_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the CRMLeadData example to its JSON schema."""
+    schema["example"] = {
+        "lead_source": "chatbot",
+        "lead_score": 0.75,
+        "lead_priority": "high",
+        "lead_type": "demo_request",
+        "confidence": 0.82,
+        "email": "john.doe@enterprise.com",
+        "name": "John Doe",
+        "company": "Enterprise Corp",
+        "original_message": "Hi, I'm interested in seeing a demo of your enterprise solution for our 500-person company.",
+        "follow_up_action": "schedule_demo",
+        "qualification_date": "2024-01-15T10:30:00Z",
+        "demo_requested": True,
+        "enterprise_inquiry": True,
+        "bulk_order_inquiry": False,
+        "scoring_factors": {
+            "intent_confidence": 0.9,
+            "keyword_density": 0.6,
+            "company_size": 0.8
+        },
+        "conversation_id": "conv_123e4567-e89b-12d3-a456-426614174000",
+        "chatbot_id": "bot_123"
+    }
 
 
 class CRMLeadData(BaseModel):
     """Model for CRM lead creation data."""
     lead_source: str = Field("chatbot", description="Source of the lead")
     lead_score: float = Field(..., description="Lead score", ge=0.0, le=1.0)
-    lead_priority: LeadPriority = Field(..., description="Lead priority level")
-    lead_type: LeadType = Field(..., description="Type of lead")
+    lead_priority: LeadPriorityValue = Field(..., description="Lead priority level")
+    lead_type: LeadTypeValue = Field(..., description="Type of lead")
     confidence: float = Field(..., description="Scoring confidence", ge=0.0, le=1.0)
     
     # Contact information
-    email: Optional[str] = Field(None, description="Contact email")
+    email: Optional[EmailStr] = Field(None, description="Contact email")
     phone: Optional[str] = Field(None, description="Contact phone")
     name: Optional[str] = Field(None, description="Contact name")
     company: Optional[str] = Field(None, description="Company name")
     
     # Lead details
-    original_message: str = Field(..., description="Original message that triggered lead", max_length=500)
+    original_message: str = Field(..., description="Original message that triggered lead", max_length=_CRM_MESSAGE_MAX_LENGTH)
     follow_up_action: Optional[str] = Field(None, description="Recommended follow-up action")
     qualification_date: str = Field(..., description="Date of qualification")
     
@@ -166,52 +256,59 @@ class CRMLeadData(BaseModel):
     conversation_id: str = Field(..., description="Associated conversation ID")
     chatbot_id: Optional[str] = Field(None, description="Chatbot that captured the lead")
     
-    @validator('email')
-    def validate_email(cls, v):
-        """Validate email format if provided."""
-        if v is not None and v.strip():
-            if '@' not in v:
-                raise ValueError('Invalid email format')
-            return v.strip().lower()
-        return v
+    @field_validator('email')
+    @classmethod
+    def normalize_email(cls, v):
+        """Lowercase the email once EmailStr has validated it."""
+        return v.lower() if v is not None else v
     
-    @validator('phone')
+    @field_validator('original_message', mode='before')
+    @classmethod
+    def truncate_original_message(cls, v):
+        """Keep only the start of long messages instead of rejecting them."""
+        return v[:_CRM_MESSAGE_MAX_LENGTH] if isinstance(v, str) else v
+    
+    @field_validator('phone')
+    @classmethod
     def validate_phone(cls, v):
         """Validate phone format if provided."""
         if v is not None and v.strip():
             # Basic phone validation - remove non-digits and check length
-            digits = ''.join(filter(str.isdigit, v))
+            digits = _NON_DIGIT.sub('', v)
             if len(digits) < 10:
                 raise ValueError('Phone number must have at least 10 digits')
             return v.strip()
         return v
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "lead_source": "chatbot",
-                "lead_score": 0.75,
-                "lead_priority": "high",
-                "lead_type": "demo_request",
-                "confidence": 0.82,
-                "email": "john.doe@enterprise.com",
-                "name": "John Doe",
-                "company": "Enterprise Corp",
-                "original_message": "Hi, I'm interested in seeing a demo of your enterprise solution for our 500-person company.",
-                "follow_up_action": "schedule_demo",
-                "qualification_date": "2024-01-15T10:30:00Z",
-                "demo_requested": True,
-                "enterprise_inquiry": True,
-                "bulk_order_inquiry": False,
-                "scoring_factors": {
-                    "intent_confidence": 0.9,
-                    "keyword_density": 0.6,
-                    "company_size": 0.8
-                },
-                "conversation_id": "conv_123e4567-e89b-12d3-a456-426614174000",
-                "chatbot_id": "bot_123"
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        defer_build=True,
+        json_schema_extra=_crm_lead_data_schema_extra
+    )
+
+
+def _lead_qualification_stats_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the LeadQualificationStats example to its JSON schema."""
+    schema["example"] = {
+        "total_leads_analyzed": 150,
+        "qualified_leads": 45,
+        "qualification_rate": 30.0,
+        "average_score": 0.42,
+        "priority_breakdown": {
+            "urgent": 5,
+            "high": 15,
+            "medium": 20,
+            "low": 5
+        },
+        "type_breakdown": {
+            "demo_request": 20,
+            "enterprise_inquiry": 10,
+            "pricing_inquiry": 15
+        },
+        "period_start": "2024-01-01T00:00:00Z",
+        "period_end": "2024-01-31T23:59:59Z"
+    }
 
 
 class LeadQualificationStats(BaseModel):
@@ -225,25 +322,9 @@ class LeadQualificationStats(BaseModel):
     period_start: str = Field(..., description="Statistics period start date")
     period_end: str = Field(..., description="Statistics period end date")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "total_leads_analyzed": 150,
-                "qualified_leads": 45,
-                "qualification_rate": 30.0,
-                "average_score": 0.42,
-                "priority_breakdown": {
-                    "urgent": 5,
-                    "high": 15,
-                    "medium": 20,
-                    "low": 5
-                },
-                "type_breakdown": {
-                    "demo_request": 20,
-                    "enterprise_inquiry": 10,
-                    "pricing_inquiry": 15
-                },
-                "period_start": "2024-01-01T00:00:00Z",
-                "period_end": "2024-01-31T23:59:59Z"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        defer_build=True,
+        json_schema_extra=_lead_qualification_stats_schema_extra
+    )
\ No newline at end of file
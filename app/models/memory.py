@@ -1,10 +1,18 @@
 """
 Pydantic models for enhanced memory-aware conversational context.
+
+Request models are validated as usual. The memory records (summaries,
+profiles, facts, topic transitions) are produced by EnhancedMemoryService
+and can be built with ``build_trusted()``, which skips validation. That is
+only safe because the service's dataclasses parse cached timestamps back
+into datetimes on load; anything not already typed must go through
+``model_validate``.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
+from typing_extensions import NotRequired, TypedDict
 
 
 class MemoryType(str, Enum):
@@ -16,6 +24,44 @@ class MemoryType(str, Enum):
     TOPIC_HISTORY = "topic_history"
 
 
+MemoryTypeValue = Literal[
+    "short_term",
+    "long_term",
+    "user_profile",
+    "contextual_facts",
+    "topic_history",
+]
+
+
+class ShortTermMessage(TypedDict):
+    """Message entry kept in short-term conversation memory."""
+    role: str
+    content: str
+    timestamp: str
+    metadata: NotRequired[Dict[str, Any]]
+
+
+class MemoryMessagePayload(TypedDict, total=False):
+    """User message or AI response submitted for a memory update."""
+    content: str
+    metadata: Dict[str, Any]
+
+
+def _conversation_summary_model_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ConversationSummaryModel example to its JSON schema."""
+    schema["example"] = {
+        "conversation_id": "conv_123",
+        "summary_text": "User inquired about pricing plans and discussed integration requirements",
+        "key_topics": ["pricing", "integration", "features"],
+        "user_goals": ["evaluate_solution", "understand_pricing"],
+        "sentiment_trend": "positive",
+        "message_count": 8,
+        "start_time": "2024-01-15T10:00:00Z",
+        "end_time": "2024-01-15T10:15:00Z",
+        "importance_score": 0.8
+    }
+
+
 class ConversationSummaryModel(BaseModel):
     """Model for conversation summary."""
     conversation_id: str = Field(..., description="Conversation ID")
@@ -28,20 +74,38 @@ class ConversationSummaryModel(BaseModel):
     end_time: datetime = Field(..., description="End time of conversation segment")
     importance_score: float = Field(..., description="Importance score of the segment", ge=0.0, le=1.0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "conversation_id": "conv_123",
-                "summary_text": "User inquired about pricing plans and discussed integration requirements",
-                "key_topics": ["pricing", "integration", "features"],
-                "user_goals": ["evaluate_solution", "understand_pricing"],
-                "sentiment_trend": "positive",
-                "message_count": 8,
-                "start_time": "2024-01-15T10:00:00Z",
-                "end_time": "2024-01-15T10:15:00Z",
-                "importance_score": 0.8
-            }
-        }
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "ConversationSummaryModel":
+        """Build from service-produced values without running validation."""
+        return cls.model_construct(**data)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra=_conversation_summary_model_schema_extra
+    )
+
+
+def _user_profile_model_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the UserProfileModel example to its JSON schema."""
+    schema["example"] = {
+        "user_id": "user_456",
+        "preferences": {
+            "communication_style": "detailed",
+            "preferred_topics": ["technical", "integration"]
+        },
+        "communication_style": "polite",
+        "technical_level": "advanced",
+        "common_questions": [
+            "How does the API work?",
+            "What are the pricing options?"
+        ],
+        "satisfaction_history": [0.8, 0.9, 0.7, 0.85],
+        "interaction_patterns": {
+            "preferred_hours": {"14": 5, "15": 3, "16": 2},
+            "session_length": "medium"
+        },
+        "last_updated": "2024-01-15T10:30:00Z"
+    }
 
 
 class UserProfileModel(BaseModel):
@@ -55,28 +119,27 @@ class UserProfileModel(BaseModel):
     interaction_patterns: Dict[str, Any] = Field(default_factory=dict, description="User interaction patterns")
     last_updated: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "user_id": "user_456",
-                "preferences": {
-                    "communication_style": "detailed",
-                    "preferred_topics": ["technical", "integration"]
-                },
-                "communication_style": "polite",
-                "technical_level": "advanced",
-                "common_questions": [
-                    "How does the API work?",
-                    "What are the pricing options?"
-                ],
-                "satisfaction_history": [0.8, 0.9, 0.7, 0.85],
-                "interaction_patterns": {
-                    "preferred_hours": {"14": 5, "15": 3, "16": 2},
-                    "session_length": "medium"
-                },
-                "last_updated": "2024-01-15T10:30:00Z"
-            }
-        }
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "UserProfileModel":
+        """Build from service-produced values without running validation."""
+        return cls.model_construct(**data)
+    
+    model_config = ConfigDict(
+        json_schema_extra=_user_profile_model_schema_extra
+    )
+
+
+def _contextual_fact_model_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ContextualFactModel example to its JSON schema."""
+    schema["example"] = {
+        "fact_id": "conv_123_abc123",
+        "conversation_id": "conv_123",
+        "fact_text": "User prefers detailed technical documentation",
+        "fact_type": "preference",
+        "confidence_score": 0.85,
+        "extracted_at": "2024-01-15T10:30:00Z",
+        "relevance_score": 0.9
+    }
 
 
 class ContextualFactModel(BaseModel):
@@ -89,18 +152,26 @@ class ContextualFactModel(BaseModel):
     extracted_at: datetime = Field(..., description="When the fact was extracted")
     relevance_score: float = Field(..., description="Relevance score for retrieval", ge=0.0, le=1.0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "fact_id": "conv_123_abc123",
-                "conversation_id": "conv_123",
-                "fact_text": "User prefers detailed technical documentation",
-                "fact_type": "preference",
-                "confidence_score": 0.85,
-                "extracted_at": "2024-01-15T10:30:00Z",
-                "relevance_score": 0.9
-            }
-        }
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "ContextualFactModel":
+        """Build from service-produced values without running validation."""
+        return cls.model_construct(**data)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra=_contextual_fact_model_schema_extra
+    )
+
+
+def _topic_transition_model_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the TopicTransitionModel example to its JSON schema."""
+    schema["example"] = {
+        "from_topic": "pricing",
+        "to_topic": "features",
+        "transition_time": "2024-01-15T10:30:00Z",
+        "transition_type": "natural",
+        "context_maintained": True
+    }
 
 
 class TopicTransitionModel(BaseModel):
@@ -111,51 +182,84 @@ class TopicTransitionModel(BaseModel):
     transition_type: str = Field(..., description="Type of transition (natural, abrupt, clarification)")
     context_maintained: bool = Field(..., description="Whether context was maintained across transition")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "from_topic": "pricing",
-                "to_topic": "features",
-                "transition_time": "2024-01-15T10:30:00Z",
-                "transition_type": "natural",
-                "context_maintained": True
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "TopicTransitionModel":
+        """Build from service-produced values without running validation."""
+        return cls.model_construct(**data)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra=_topic_transition_model_schema_extra
+    )
+
+
+def _conversation_memory_model_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ConversationMemoryModel example to its JSON schema."""
+    schema["example"] = {
+        "conversation_id": "conv_123",
+        "short_term_memory": [
+            {
+                "role": "user",
+                "content": "What are your pricing plans?",
+                "timestamp": "2024-01-15T10:30:00Z",
+                "metadata": {}
             }
-        }
+        ],
+        "long_term_memory": [],
+        "user_profile": {
+            "user_id": "user_456",
+            "communication_style": "polite",
+            "technical_level": "intermediate"
+        },
+        "contextual_facts": [],
+        "topic_history": [],
+        "last_updated": "2024-01-15T10:30:00Z"
+    }
 
 
 class ConversationMemoryModel(BaseModel):
     """Comprehensive conversation memory model."""
     conversation_id: str = Field(..., description="Conversation ID")
-    short_term_memory: List[Dict[str, Any]] = Field(default_factory=list, description="Recent messages")
+    short_term_memory: List[ShortTermMessage] = Field(default_factory=list, description="Recent messages")
     long_term_memory: List[ConversationSummaryModel] = Field(default_factory=list, description="Conversation summaries")
     user_profile: Optional[UserProfileModel] = Field(None, description="User profile data")
     contextual_facts: List[ContextualFactModel] = Field(default_factory=list, description="Extracted contextual facts")
     topic_history: List[TopicTransitionModel] = Field(default_factory=list, description="Topic transition history")
     last_updated: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "conversation_id": "conv_123",
-                "short_term_memory": [
-                    {
-                        "role": "user",
-                        "content": "What are your pricing plans?",
-                        "timestamp": "2024-01-15T10:30:00Z",
-                        "metadata": {}
-                    }
-                ],
-                "long_term_memory": [],
-                "user_profile": {
-                    "user_id": "user_456",
-                    "communication_style": "polite",
-                    "technical_level": "intermediate"
-                },
-                "contextual_facts": [],
-                "topic_history": [],
-                "last_updated": "2024-01-15T10:30:00Z"
-            }
-        }
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "ConversationMemoryModel":
+        """Build from service-produced values, nested records included, without running validation."""
+        user_profile = data.get("user_profile")
+        data["long_term_memory"] = [
+            ConversationSummaryModel.build_trusted(**summary)
+            for summary in data.get("long_term_memory", [])
+        ]
+        data["user_profile"] = UserProfileModel.build_trusted(**user_profile) if user_profile else None
+        data["contextual_facts"] = [
+            ContextualFactModel.build_trusted(**fact)
+            for fact in data.get("contextual_facts", [])
+        ]
+        data["topic_history"] = [
+            TopicTransitionModel.build_trusted(**transition)
+            for transition in data.get("topic_history", [])
+        ]
+        return cls.model_construct(**data)
+    
+    model_config = ConfigDict(
+        json_schema_extra=_conversation_memory_model_schema_extra
+    )
+
+
+def _memory_retrieval_request_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the MemoryRetrievalRequest example to its JSON schema."""
+    schema["example"] = {
+        "conversation_id": "conv_123",
+        "user_id": "user_456",
+        "current_message": "Can you tell me more about the integration process?",
+        "max_items": 5,
+        "memory_types": ["short_term", "contextual_facts"]
+    }
 
 
 class MemoryRetrievalRequest(BaseModel):
@@ -164,26 +268,42 @@ class MemoryRetrievalRequest(BaseModel):
     user_id: str = Field(..., description="User ID")
     current_message: str = Field(..., description="Current user message")
     max_items: int = Field(5, description="Maximum number of items to retrieve", ge=1, le=20)
-    memory_types: List[MemoryType] = Field(
-        default_factory=lambda: [MemoryType.SHORT_TERM, MemoryType.CONTEXTUAL_FACTS],
+    memory_types: List[MemoryTypeValue] = Field(
+        default_factory=lambda: ["short_term", "contextual_facts"],
         description="Types of memory to retrieve"
     )
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "conversation_id": "conv_123",
-                "user_id": "user_456",
-                "current_message": "Can you tell me more about the integration process?",
-                "max_items": 5,
-                "memory_types": ["short_term", "contextual_facts"]
+    model_config = ConfigDict(
+        json_schema_extra=_memory_retrieval_request_schema_extra
+    )
+
+
+def _memory_retrieval_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the MemoryRetrievalResponse example to its JSON schema."""
+    schema["example"] = {
+        "recent_context": [
+            {
+                "role": "user",
+                "content": "What are your pricing plans?",
+                "timestamp": "2024-01-15T10:30:00Z"
             }
-        }
+        ],
+        "relevant_facts": [],
+        "relevant_summaries": [],
+        "user_profile": {
+            "user_id": "user_456",
+            "communication_style": "polite",
+            "technical_level": "intermediate"
+        },
+        "current_topic": "integration",
+        "topic_history": [],
+        "context_quality_score": 0.85
+    }
 
 
 class MemoryRetrievalResponse(BaseModel):
     """Response model for memory retrieval."""
-    recent_context: List[Dict[str, Any]] = Field(default_factory=list, description="Recent conversation context")
+    recent_context: List[ShortTermMessage] = Field(default_factory=list, description="Recent conversation context")
     relevant_facts: List[ContextualFactModel] = Field(default_factory=list, description="Relevant contextual facts")
     relevant_summaries: List[ConversationSummaryModel] = Field(default_factory=list, description="Relevant conversation summaries")
     user_profile: Optional[UserProfileModel] = Field(None, description="User profile data")
@@ -191,52 +311,51 @@ class MemoryRetrievalResponse(BaseModel):
     topic_history: List[TopicTransitionModel] = Field(default_factory=list, description="Recent topic transitions")
     context_quality_score: float = Field(..., description="Quality score of retrieved context", ge=0.0, le=1.0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "recent_context": [
-                    {
-                        "role": "user",
-                        "content": "What are your pricing plans?",
-                        "timestamp": "2024-01-15T10:30:00Z"
-                    }
-                ],
-                "relevant_facts": [],
-                "relevant_summaries": [],
-                "user_profile": {
-                    "user_id": "user_456",
-                    "communication_style": "polite",
-                    "technical_level": "intermediate"
-                },
-                "current_topic": "integration",
-                "topic_history": [],
-                "context_quality_score": 0.85
-            }
+    model_config = ConfigDict(
+        json_schema_extra=_memory_retrieval_response_schema_extra
+    )
+
+
+def _memory_update_request_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the MemoryUpdateRequest example to its JSON schema."""
+    schema["example"] = {
+        "conversation_id": "conv_123",
+        "user_id": "user_456",
+        "user_message": {
+            "content": "What are your pricing plans?",
+            "metadata": {"sentiment": "neutral"}
+        },
+        "ai_response": {
+            "content": "We offer three pricing tiers...",
+            "metadata": {"confidence": 0.9}
         }
+    }
 
 
 class MemoryUpdateRequest(BaseModel):
     """Request model for memory updates."""
     conversation_id: str = Field(..., description="Conversation ID")
     user_id: str = Field(..., description="User ID")
-    user_message: Dict[str, Any] = Field(..., description="User message data")
-    ai_response: Dict[str, Any] = Field(..., description="AI response data")
+    user_message: MemoryMessagePayload = Field(..., description="User message data")
+    ai_response: MemoryMessagePayload = Field(..., description="AI response data")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "conversation_id": "conv_123",
-                "user_id": "user_456",
-                "user_message": {
-                    "content": "What are your pricing plans?",
-                    "metadata": {"sentiment": "neutral"}
-                },
-                "ai_response": {
-                    "content": "We offer three pricing tiers...",
-                    "metadata": {"confidence": 0.9}
-                }
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_memory_update_request_schema_extra
+    )
+
+
+def _memory_update_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the MemoryUpdateResponse example to its JSON schema."""
+    schema["example"] = {
+        "success": True,
+        "memory_summary": {
+            "short_term_messages": 4,
+            "total_facts": 2,
+            "current_topic": "pricing"
+        },
+        "new_facts_extracted": 1,
+        "topic_transitions": 1
+    }
 
 
 class MemoryUpdateResponse(BaseModel):
@@ -246,19 +365,22 @@ class MemoryUpdateResponse(BaseModel):
     new_facts_extracted: int = Field(..., description="Number of new facts extracted", ge=0)
     topic_transitions: int = Field(..., description="Number of topic transitions detected", ge=0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "success": True,
-                "memory_summary": {
-                    "short_term_messages": 4,
-                    "total_facts": 2,
-                    "current_topic": "pricing"
-                },
-                "new_facts_extracted": 1,
-                "topic_transitions": 1
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_memory_update_response_schema_extra
+    )
+
+
+def _conversation_context_request_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ConversationContextRequest example to its JSON schema."""
+    schema["example"] = {
+        "conversation_id": "conv_123",
+        "user_id": "user_456",
+        "current_message": "Can you explain the integration process?",
+        "include_user_profile": True,
+        "include_facts": True,
+        "include_summaries": True,
+        "max_context_length": 2000
+    }
 
 
 class ConversationContextRequest(BaseModel):
@@ -271,18 +393,24 @@ class ConversationContextRequest(BaseModel):
     include_summaries: bool = Field(True, description="Whether to include conversation summaries")
     max_context_length: int = Field(2000, description="Maximum context length in characters", ge=100, le=5000)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "conversation_id": "conv_123",
-                "user_id": "user_456",
-                "current_message": "Can you explain the integration process?",
-                "include_user_profile": True,
-                "include_facts": True,
-                "include_summaries": True,
-                "max_context_length": 2000
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_conversation_context_request_schema_extra
+    )
+
+
+def _conversation_context_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ConversationContextResponse example to its JSON schema."""
+    schema["example"] = {
+        "formatted_context": "User Profile: Communication style: polite, Technical level: intermediate\n\nRecent Conversation:\nUser: What are your pricing plans?\nAssistant: We offer three pricing tiers...",
+        "context_components": {
+            "user_profile": True,
+            "recent_messages": 2,
+            "facts": 1,
+            "summaries": 0
+        },
+        "context_length": 245,
+        "truncated": False
+    }
 
 
 class ConversationContextResponse(BaseModel):
@@ -292,20 +420,21 @@ class ConversationContextResponse(BaseModel):
     context_length: int = Field(..., description="Total context length in characters", ge=0)
     truncated: bool = Field(..., description="Whether context was truncated due to length limits")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "formatted_context": "User Profile: Communication style: polite, Technical level: intermediate\n\nRecent Conversation:\nUser: What are your pricing plans?\nAssistant: We offer three pricing tiers...",
-                "context_components": {
-                    "user_profile": True,
-                    "recent_messages": 2,
-                    "facts": 1,
-                    "summaries": 0
-                },
-                "context_length": 245,
-                "truncated": False
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_conversation_context_response_schema_extra
+    )
+
+
+def _memory_service_status_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the MemoryServiceStatus example to its JSON schema."""
+    schema["example"] = {
+        "service_ready": True,
+        "redis_connected": True,
+        "supabase_connected": True,
+        "memory_window_size": 20,
+        "summary_threshold": 50,
+        "profile_retention_days": 30
+    }
 
 
 class MemoryServiceStatus(BaseModel):
@@ -317,14 +446,6 @@ class MemoryServiceStatus(BaseModel):
     summary_threshold: int = Field(..., description="Conversation summary threshold")
     profile_retention_days: int = Field(..., description="User profile retention period in days")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "service_ready": True,
-                "redis_connected": True,
-                "supabase_connected": True,
-                "memory_window_size": 20,
-                "summary_threshold": 50,
-                "profile_retention_days": 30
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        json_schema_extra=_memory_service_status_schema_extra
+    )
\ No newline at end of file
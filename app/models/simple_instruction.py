@@ -1,27 +1,40 @@
 """
 Simplified Pydantic models for chatbot instruction endpoints.
 """
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def _chatbot_instruction_update_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ChatbotInstructionUpdate example to its JSON schema."""
+    schema["example"] = {
+        "instructions": "You are a customer service assistant for TechCorp. Always be polite, professional, and helpful. When users ask about pricing, direct them to our sales team. For technical issues, provide step-by-step solutions."
+    }
 
 
 class ChatbotInstructionUpdate(BaseModel):
     """Request model for updating chatbot instruction."""
     instructions: str = Field(..., description="System instruction for the chatbot", min_length=1)
     
-    @validator('instructions')
+    @field_validator('instructions')
+    @classmethod
     def validate_instruction(cls, v):
         """Validate instruction format."""
         if not v or not v.strip():
             raise ValueError('Instruction cannot be empty')
         return v.strip()
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "instructions": "You are a customer service assistant for TechCorp. Always be polite, professional, and helpful. When users ask about pricing, direct them to our sales team. For technical issues, provide step-by-step solutions."
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_chatbot_instruction_update_schema_extra
+    )
+
+
+def _chatbot_instruction_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ChatbotInstructionResponse example to its JSON schema."""
+    schema["example"] = {
+        "chatbot_id": "cm789xyz123abc",
+        "instructions": "You are a customer service assistant for TechCorp. Always be polite, professional, and helpful."
+    }
 
 
 class ChatbotInstructionResponse(BaseModel):
@@ -29,13 +42,24 @@ class ChatbotInstructionResponse(BaseModel):
     chatbot_id: str = Field(..., description="Chatbot ID")
     instructions: str = Field(..., description="System instruction for the chatbot")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "chatbot_id": "cm789xyz123abc",
-                "instructions": "You are a customer service assistant for TechCorp. Always be polite, professional, and helpful."
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_chatbot_instruction_response_schema_extra
+    )
+
+
+def _chatbot_with_instruction_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ChatbotWithInstructionResponse example to its JSON schema."""
+    schema["example"] = {
+        "id": "cm789xyz123abc",
+        "name": "Customer Support Bot",
+        "welcomeMessage": "Hello! How can I help you today?",
+        "primaryColor": "#3B82F6",
+        "isActive": True,
+        "instructions": "You are a customer service assistant for TechCorp. Always be polite, professional, and helpful.",
+        "userId": "user123",
+        "createdAt": "2024-01-15T10:30:00Z",
+        "updatedAt": "2024-01-15T10:30:00Z"
+    }
 
 
 class ChatbotWithInstructionResponse(BaseModel):
@@ -50,17 +74,6 @@ class ChatbotWithInstructionResponse(BaseModel):
     createdAt: str = Field(..., description="Creation timestamp")
     updatedAt: str = Field(..., description="Last update timestamp")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "cm789xyz123abc",
-                "name": "Customer Support Bot",
-                "welcomeMessage": "Hello! How can I help you today?",
-                "primaryColor": "#3B82F6",
-                "isActive": True,
-                "instructions": "You are a customer service assistant for TechCorp. Always be polite, professional, and helpful.",
-                "userId": "user123",
-                "createdAt": "2024-01-15T10:30:00Z",
-                "updatedAt": "2024-01-15T10:30:00Z"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        json_schema_extra=_chatbot_with_instruction_response_schema_extra
+    )
\ No newline at end of file
@@ -1,11 +1,22 @@
 """
 Pydantic models for vision analysis endpoints and services.
 """
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, List, Literal, Optional, Dict, Any, Union
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 from enum import Enum
 import uuid
 
+_IMAGE_URL_PREFIXES = ('http://', 'https://', 'data:')
+
 
 class AnalysisType(str, Enum):
     """Supported analysis types for vision API."""
@@ -15,39 +26,60 @@ class AnalysisType(str, Enum):
     CUSTOM = "custom"
 
 
+AnalysisTypeValue = Literal["product_condition", "invoice_extraction", "inventory_count", "custom"]
+
+
+def _vision_analysis_request_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the VisionAnalysisRequest example to its JSON schema."""
+    schema["example"] = {
+        "image_url": "https://example.com/product-image.jpg",
+        "analysis_type": "product_condition",
+        "custom_prompt": None
+    }
+
+
 class VisionAnalysisRequest(BaseModel):
     """Request model for vision analysis endpoint."""
     image_url: str = Field(..., description="URL of the image to analyze")
-    analysis_type: AnalysisType = Field(..., description="Type of analysis to perform")
+    analysis_type: AnalysisTypeValue = Field(..., description="Type of analysis to perform")
     custom_prompt: Optional[str] = Field(None, description="Custom prompt for analysis (required for custom type)")
     
-    @validator('image_url')
+    @field_validator('image_url')
+    @classmethod
     def validate_image_url(cls, v):
         """Validate image URL format."""
         if not v or not v.strip():
             raise ValueError('Image URL cannot be empty')
         # Basic URL validation
-        if not (v.startswith('http://') or v.startswith('https://') or v.startswith('data:')):
+        if not v.startswith(_IMAGE_URL_PREFIXES):
             raise ValueError('Invalid image URL format')
         return v.strip()
     
-    @validator('custom_prompt')
-    def validate_custom_prompt(cls, v, values):
+    @field_validator('custom_prompt')
+    @classmethod
+    def validate_custom_prompt(cls, v, info: ValidationInfo):
         """Validate custom prompt when analysis type is custom."""
-        if values.get('analysis_type') == AnalysisType.CUSTOM:
+        if info.data.get('analysis_type') == AnalysisType.CUSTOM:
             if not v or not v.strip():
                 raise ValueError('Custom prompt is required for custom analysis type')
             return v.strip()
         return v
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "image_url": "https://example.com/product-image.jpg",
-                "analysis_type": "product_condition",
-                "custom_prompt": None
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_vision_analysis_request_schema_extra
+    )
+
+
+def _product_condition_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ProductCondition example to its JSON schema."""
+    schema["example"] = {
+        "condition": "good",
+        "condition_score": 0.8,
+        "damage_detected": False,
+        "damage_description": None,
+        "return_eligible": True,
+        "confidence": 0.92
+    }
 
 
 class ProductCondition(BaseModel):
@@ -59,17 +91,26 @@ class ProductCondition(BaseModel):
     return_eligible: bool = Field(..., description="Whether the product is eligible for return")
     confidence: float = Field(..., description="Analysis confidence score", ge=0.0, le=1.0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "condition": "good",
-                "condition_score": 0.8,
-                "damage_detected": False,
-                "damage_description": None,
-                "return_eligible": True,
-                "confidence": 0.92
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_product_condition_schema_extra
+    )
+
+
+def _invoice_data_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the InvoiceData example to its JSON schema."""
+    schema["example"] = {
+        "vendor_name": "ACME Corp",
+        "invoice_number": "INV-2024-001",
+        "invoice_date": "2024-01-15",
+        "due_date": "2024-02-15",
+        "total_amount": 1250.00,
+        "currency": "USD",
+        "line_items": [
+            {"description": "Product A", "quantity": 2, "unit_price": 500.00, "total": 1000.00},
+            {"description": "Shipping", "quantity": 1, "unit_price": 250.00, "total": 250.00}
+        ],
+        "confidence": 0.95
+    }
 
 
 class InvoiceData(BaseModel):
@@ -83,22 +124,22 @@ class InvoiceData(BaseModel):
     line_items: List[Dict[str, Any]] = Field(default_factory=list, description="Invoice line items")
     confidence: float = Field(..., description="Extraction confidence score", ge=0.0, le=1.0)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "vendor_name": "ACME Corp",
-                "invoice_number": "INV-2024-001",
-                "invoice_date": "2024-01-15",
-                "due_date": "2024-02-15",
-                "total_amount": 1250.00,
-                "currency": "USD",
-                "line_items": [
-                    {"description": "Product A", "quantity": 2, "unit_price": 500.00, "total": 1000.00},
-                    {"description": "Shipping", "quantity": 1, "unit_price": 250.00, "total": 250.00}
-                ],
-                "confidence": 0.95
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_invoice_data_schema_extra
+    )
+
+
+def _inventory_count_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the InventoryCount example to its JSON schema."""
+    schema["example"] = {
+        "total_items": 45,
+        "item_categories": {
+            "boxes": 30,
+            "pallets": 15
+        },
+        "confidence": 0.88,
+        "notes": "Some items may be partially obscured"
+    }
 
 
 class InventoryCount(BaseModel):
@@ -108,18 +149,53 @@ class InventoryCount(BaseModel):
     confidence: float = Field(..., description="Counting confidence score", ge=0.0, le=1.0)
     notes: Optional[str] = Field(None, description="Additional notes about the count")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "total_items": 45,
-                "item_categories": {
-                    "boxes": 30,
-                    "pallets": 15
-                },
-                "confidence": 0.88,
-                "notes": "Some items may be partially obscured"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_inventory_count_schema_extra
+    )
+
+
+# Structured result model for each analysis type; custom results stay plain dicts
+_RESULT_MODELS = {
+    AnalysisType.PRODUCT_CONDITION: ProductCondition,
+    AnalysisType.INVOICE_EXTRACTION: InvoiceData,
+    AnalysisType.INVENTORY_COUNT: InventoryCount,
+}
+_RESULT_TAGS = {model: analysis_type.value for analysis_type, model in _RESULT_MODELS.items()}
+
+
+def _result_tag(result: Any) -> str:
+    """Pick the union branch for an analysis result without trying each one."""
+    return _RESULT_TAGS.get(type(result), AnalysisType.CUSTOM.value)
+
+
+AnalysisResult = Annotated[
+    Union[
+        Annotated[ProductCondition, Tag(AnalysisType.PRODUCT_CONDITION.value)],
+        Annotated[InvoiceData, Tag(AnalysisType.INVOICE_EXTRACTION.value)],
+        Annotated[InventoryCount, Tag(AnalysisType.INVENTORY_COUNT.value)],
+        Annotated[Dict[str, Any], Tag(AnalysisType.CUSTOM.value)],
+    ],
+    Discriminator(_result_tag),
+]
+
+
+def _vision_analysis_response_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the VisionAnalysisResponse example to its JSON schema."""
+    schema["example"] = {
+        "analysis_id": "analysis_123e4567-e89b-12d3-a456-426614174000",
+        "analysis_type": "product_condition",
+        "image_url": "https://example.com/product-image.jpg",
+        "result": {
+            "condition": "good",
+            "condition_score": 0.8,
+            "damage_detected": False,
+            "damage_description": None,
+            "return_eligible": True,
+            "confidence": 0.92
+        },
+        "processing_time_ms": 1250.5,
+        "created_at": "2024-01-15T10:30:00Z"
+    }
 
 
 class VisionAnalysisResponse(BaseModel):
@@ -127,28 +203,44 @@ class VisionAnalysisResponse(BaseModel):
     analysis_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique analysis ID")
     analysis_type: AnalysisType = Field(..., description="Type of analysis performed")
     image_url: str = Field(..., description="URL of the analyzed image")
-    result: Union[ProductCondition, InvoiceData, InventoryCount, Dict[str, Any]] = Field(..., description="Analysis results")
+    result: AnalysisResult = Field(..., description="Analysis results")
     processing_time_ms: float = Field(..., description="Processing time in milliseconds", ge=0.0)
     created_at: str = Field(..., description="Analysis timestamp")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "analysis_id": "analysis_123e4567-e89b-12d3-a456-426614174000",
-                "analysis_type": "product_condition",
-                "image_url": "https://example.com/product-image.jpg",
-                "result": {
-                    "condition": "good",
-                    "condition_score": 0.8,
-                    "damage_detected": False,
-                    "damage_description": None,
-                    "return_eligible": True,
-                    "confidence": 0.92
-                },
-                "processing_time_ms": 1250.5,
-                "created_at": "2024-01-15T10:30:00Z"
-            }
-        }
+    @model_validator(mode='before')
+    @classmethod
+    def build_result(cls, data: Any) -> Any:
+        """Validate a raw result dict against the model for its analysis type."""
+        if isinstance(data, dict) and isinstance(data.get("result"), dict):
+            result_model = _RESULT_MODELS.get(data.get("analysis_type"))
+            if result_model is not None:
+                data = {**data, "result": result_model.model_validate(data["result"])}
+        return data
+    
+    model_config = ConfigDict(
+        json_schema_extra=_vision_analysis_response_schema_extra
+    )
+
+
+def _image_analysis_record_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the ImageAnalysisRecord example to its JSON schema."""
+    schema["example"] = {
+        "id": "img_analysis_123e4567-e89b-12d3-a456-426614174000",
+        "message_id": "msg_123e4567-e89b-12d3-a456-426614174000",
+        "image_url": "https://example.com/product-image.jpg",
+        "analysis_type": "product_condition",
+        "prompt": "Analyze this product image for condition and return eligibility...",
+        "analysis_result": {
+            "condition": "good",
+            "condition_score": 0.8,
+            "damage_detected": False,
+            "return_eligible": True,
+            "confidence": 0.92
+        },
+        "processing_time": 1250,
+        "confidence_score": 0.92,
+        "created_at": "2024-01-15T10:30:00Z"
+    }
 
 
 class ImageAnalysisRecord(BaseModel):
@@ -163,26 +255,18 @@ class ImageAnalysisRecord(BaseModel):
     confidence_score: Optional[float] = Field(None, description="Overall confidence score", ge=0.0, le=1.0)
     created_at: str = Field(..., description="Analysis timestamp")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "img_analysis_123e4567-e89b-12d3-a456-426614174000",
-                "message_id": "msg_123e4567-e89b-12d3-a456-426614174000",
-                "image_url": "https://example.com/product-image.jpg",
-                "analysis_type": "product_condition",
-                "prompt": "Analyze this product image for condition and return eligibility...",
-                "analysis_result": {
-                    "condition": "good",
-                    "condition_score": 0.8,
-                    "damage_detected": False,
-                    "return_eligible": True,
-                    "confidence": 0.92
-                },
-                "processing_time": 1250,
-                "confidence_score": 0.92,
-                "created_at": "2024-01-15T10:30:00Z"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_image_analysis_record_schema_extra
+    )
+
+
+def _vision_error_schema_extra(schema: Dict[str, Any]) -> None:
+    """Add the VisionError example to its JSON schema."""
+    schema["example"] = {
+        "error_type": "invalid_image",
+        "error_message": "Unable to process image: unsupported format",
+        "image_url": "https://example.com/invalid-image.txt"
+    }
 
 
 class VisionError(BaseModel):
@@ -191,11 +275,6 @@ class VisionError(BaseModel):
     error_message: str = Field(..., description="Error message")
     image_url: Optional[str] = Field(None, description="URL of the image that caused the error")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "error_type": "invalid_image",
-                "error_message": "Unable to process image: unsupported format",
-                "image_url": "https://example.com/invalid-image.txt"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        json_schema_extra=_vision_error_schema_extra
+    )
\ No newline at end of file
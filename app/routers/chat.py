@@ -152,8 +152,9 @@ async def chat_endpoint(
                 detail="Message cannot be empty"
             )
         
-        # Override user_id from validated API key
-        validated_request = ChatRequest(
+        # Override user_id from validated API key; the body fields were
+        # already validated by FastAPI, so build without re-validating
+        validated_request = ChatRequest.model_construct(
             message=request.message.strip(),
             user_id=user_id,
             conversation_id=request.conversation_id
@@ -341,8 +342,9 @@ async def chat_stream_endpoint(
             logger.warning(f"Enhanced streaming failed, falling back to standard: {enhanced_error}")
         
         # Fallback to standard streaming
-        # Override user_id from validated API key
-        validated_request = ChatRequest(
+        # Override user_id from validated API key; the body fields were
+        # already validated by FastAPI, so build without re-validating
+        validated_request = ChatRequest.model_construct(
             message=request.message.strip(),
             user_id=user_id,
             conversation_id=request.conversation_id
@@ -363,11 +365,11 @@ async def chat_stream_endpoint(
             """Generate Server-Sent Events stream for chat response."""
             try:
                 async for response_chunk in rag_service.generate_response_stream(validated_request):
-                    # Convert response to JSON
-                    chunk_data = response_chunk.dict()
+                    # Serialize straight to JSON via pydantic-core
+                    chunk_data = response_chunk.model_dump_json()
                     
                     # Format as Server-Sent Event
-                    sse_data = f"data: {json.dumps(chunk_data)}\n\n"
+                    sse_data = f"data: {chunk_data}\n\n"
                     yield sse_data
                     
                     # If this is the completion signal, break
@@ -382,7 +384,7 @@ async def chat_stream_endpoint(
                     content=None,
                     metadata={"error": str(e)}
                 )
-                error_data = f"data: {json.dumps(error_response.dict())}\n\n"
+                error_data = f"data: {error_response.model_dump_json()}\n\n"
                 yield error_data
                 
                 # Send completion event
@@ -391,7 +393,7 @@ async def chat_stream_endpoint(
                     content=None,
                     metadata=None
                 )
-                done_data = f"data: {json.dumps(done_response.dict())}\n\n"
+                done_data = f"data: {done_response.model_dump_json()}\n\n"
                 yield done_data
         
         processing_time = (time.time() - start_time) * 1000
@@ -575,8 +577,9 @@ async def chat_widget_stream_endpoint(request: ChatRequestWithApiKey):
             logger.warning(f"Enhanced widget streaming failed, falling back to standard: {enhanced_error}")
         
         # Fallback to standard streaming
-        # Create validated request with chatbot_id and session info
-        validated_request = ChatRequest(
+        # Create validated request with chatbot_id and session info,
+        # reusing the body fields FastAPI already validated
+        validated_request = ChatRequest.model_construct(
             message=request.message,
             user_id=user_id,
             chatbot_id=chatbot_id,
@@ -600,11 +603,11 @@ async def chat_widget_stream_endpoint(request: ChatRequestWithApiKey):
             """Generate Server-Sent Events stream for widget chat response."""
             try:
                 async for response_chunk in rag_service.generate_response_stream(validated_request):
-                    # Convert response to JSON
-                    chunk_data = response_chunk.dict()
+                    # Serialize straight to JSON via pydantic-core
+                    chunk_data = response_chunk.model_dump_json()
                     
                     # Format as Server-Sent Event
-                    sse_data = f"data: {json.dumps(chunk_data)}\n\n"
+                    sse_data = f"data: {chunk_data}\n\n"
                     yield sse_data
                     
                     # If this is the completion signal, break
@@ -619,7 +622,7 @@ async def chat_widget_stream_endpoint(request: ChatRequestWithApiKey):
                     content=None,
                     metadata={"error": str(e)}
                 )
-                error_data = f"data: {json.dumps(error_response.dict())}\n\n"
+                error_data = f"data: {error_response.model_dump_json()}\n\n"
                 yield error_data
                 
                 # Send completion event
@@ -628,7 +631,7 @@ async def chat_widget_stream_endpoint(request: ChatRequestWithApiKey):
                     content=None,
                     metadata=None
                 )
-                done_data = f"data: {json.dumps(done_response.dict())}\n\n"
+                done_data = f"data: {done_response.model_dump_json()}\n\n"
                 yield done_data
         
         processing_time = (time.time() - start_time) * 1000
@@ -693,8 +696,9 @@ async def get_chat_context(
                 detail="Message cannot be empty"
             )
         
-        # Override user_id from validated API key
-        validated_request = ChatRequest(
+        # Override user_id from validated API key; the body fields were
+        # already validated by FastAPI, so build without re-validating
+        validated_request = ChatRequest.model_construct(
             message=request.message.strip(),
             user_id=user_id,
             conversation_id=request.conversation_id
@@ -759,8 +763,9 @@ async def chat_widget_endpoint(request: ChatRequestWithApiKey):
         user_id = chatbot_info["user_id"]
         logger.info(f"Valid chatbot API key for widget request from chatbot: {chatbot_info['name']}")
         
-        # Create validated request with chatbot_id and session info
-        validated_request = ChatRequest(
+        # Create validated request with chatbot_id and session info,
+        # reusing the body fields FastAPI already validated
+        validated_request = ChatRequest.model_construct(
             message=request.message,
             user_id=user_id,
             chatbot_id=chatbot_id,
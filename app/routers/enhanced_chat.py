@@ -93,8 +93,9 @@ async def enhanced_chat_endpoint(
                 detail="Message cannot be empty"
             )
         
-        # Override user_id from validated API key
-        validated_request = ChatRequest(
+        # Override user_id from validated API key; the body fields were
+        # already validated by FastAPI, so build without re-validating
+        validated_request = ChatRequest.model_construct(
             message=request.message.strip(),
             user_id=user_id,
             conversation_id=request.conversation_id
@@ -171,8 +172,9 @@ async def enhanced_chat_widget_endpoint(request: ChatRequestWithApiKey):
         user_id = chatbot_info["user_id"]
         logger.info(f"Valid chatbot API key for enhanced widget request from chatbot: {chatbot_info['name']}")
         
-        # Create validated request with chatbot_id and session info
-        validated_request = ChatRequest(
+        # Create validated request with chatbot_id and session info,
+        # reusing the body fields FastAPI already validated
+        validated_request = ChatRequest.model_construct(
             message=request.message,
             user_id=user_id,
             chatbot_id=chatbot_id,
@@ -252,16 +254,13 @@ async def decision_analysis_endpoint(
                 detail="Message cannot be empty"
             )
         
-        # Override user_id from validated API key
-        validated_request = DecisionRequest(
-            message=request.message.strip(),
-            conversation_history=request.conversation_history,
-            user_id=user_id,
-            chatbot_id=request.chatbot_id,
-            conversation_id=request.conversation_id,
-            rag_response=request.rag_response,
-            context_documents=request.context_documents
-        )
+        # Override user_id from validated API key; the body was already
+        # validated by FastAPI, so copy it instead of re-validating the
+        # conversation history and context documents
+        validated_request = request.model_copy(update={
+            "message": request.message.strip(),
+            "user_id": user_id
+        })
         
         # Get enhanced RAG service
         enhanced_rag_service = get_enhanced_rag_service()
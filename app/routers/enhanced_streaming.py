@@ -3,7 +3,6 @@ Enhanced streaming router with intelligent response generation and fallback stra
 """
 import logging
 import time
-import json
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Header, Depends
 from fastapi.responses import StreamingResponse
@@ -138,12 +137,8 @@ async def enhanced_stream_endpoint(
                     validated_request, 
                     config
                 ):
-                    # Convert response to JSON
-                    chunk_data = response_chunk.dict(exclude_none=True)
-                    
                     # Format as Server-Sent Event
-                    sse_data = f"data: {json.dumps(chunk_data)}\n\n"
-                    yield sse_data
+                    yield response_chunk.to_sse_bytes()
                     
                     # If this is the completion signal, break
                     if response_chunk.type == "done":
@@ -158,16 +153,14 @@ async def enhanced_stream_endpoint(
                     error_message=f"Streaming error: {str(e)}",
                     metadata={"timestamp": time.time()}
                 )
-                error_data = f"data: {json.dumps(error_response.dict(exclude_none=True))}\n\n"
-                yield error_data
+                yield error_response.to_sse_bytes()
                 
                 # Send completion event
                 done_response = EnhancedStreamResponse(
                     type="done",
                     metadata={"error": True, "timestamp": time.time()}
                 )
-                done_data = f"data: {json.dumps(done_response.dict(exclude_none=True))}\n\n"
-                yield done_data
+                yield done_response.to_sse_bytes()
         
         processing_time = (time.time() - start_time) * 1000
         logger.info(f"Started enhanced streaming response in {processing_time:.2f}ms for user {user_id}")
@@ -282,12 +275,8 @@ async def enhanced_stream_widget_endpoint(request: EnhancedStreamRequestWithApiK
                     validated_request, 
                     config
                 ):
-                    # Convert response to JSON
-                    chunk_data = response_chunk.dict(exclude_none=True)
-                    
                     # Format as Server-Sent Event
-                    sse_data = f"data: {json.dumps(chunk_data)}\n\n"
-                    yield sse_data
+                    yield response_chunk.to_sse_bytes()
                     
                     # If this is the completion signal, break
                     if response_chunk.type == "done":
@@ -302,16 +291,14 @@ async def enhanced_stream_widget_endpoint(request: EnhancedStreamRequestWithApiK
                     error_message=f"Widget streaming error: {str(e)}",
                     metadata={"timestamp": time.time()}
                 )
-                error_data = f"data: {json.dumps(error_response.dict(exclude_none=True))}\n\n"
-                yield error_data
+                yield error_response.to_sse_bytes()
                 
                 # Send completion event
                 done_response = EnhancedStreamResponse(
                     type="done",
                     metadata={"error": True, "timestamp": time.time()}
                 )
-                done_data = f"data: {json.dumps(done_response.dict(exclude_none=True))}\n\n"
-                yield done_data
+                yield done_response.to_sse_bytes()
         
         processing_time = (time.time() - start_time) * 1000
         logger.info(f"Started enhanced widget streaming response in {processing_time:.2f}ms for user {user_id}")
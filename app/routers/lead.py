@@ -75,8 +75,8 @@ async def analyze_lead_potential(request: LeadAnalysisRequest):
         # Build response
         response = LeadScoreResponse(
             total_score=lead_score.total_score,
-            priority=lead_score.priority,
-            lead_type=lead_score.lead_type,
+            priority=lead_score.priority.value,
+            lead_type=lead_score.lead_type.value,
             confidence=lead_score.confidence,
             should_qualify=should_qualify,
             factors=lead_score.factors,
@@ -125,16 +125,15 @@ async def create_qualification_trigger(
         if chatbot_id:
             metadata["chatbot_id"] = chatbot_id
         
-        # Create trigger event
-        trigger = LeadQualificationTrigger(
+        # Create trigger event; the score and query parameters are already validated
+        trigger = LeadQualificationTrigger.build_trusted(
             trigger_id=trigger_id,
             lead_score=lead_score,
             conversation_id=conversation_id,
             user_email=user_email,
             message_id=message_id,
             trigger_type="lead_qualification",
-            metadata=metadata,
-            created_at=datetime.utcnow().isoformat()
+            metadata=metadata
         )
         
         logger.info(f"Lead qualification trigger created: {trigger_id} for conversation {conversation_id}")
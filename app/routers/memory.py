@@ -2,9 +2,10 @@
 API router for enhanced memory-aware conversational context endpoints.
 """
 import logging
+from dataclasses import asdict
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.models.memory import (
     MemoryRetrievalRequest,
@@ -14,7 +15,11 @@ from app.models.memory import (
     ConversationContextRequest,
     ConversationContextResponse,
     MemoryServiceStatus,
-    ConversationMemoryModel
+    ConversationMemoryModel,
+    ConversationSummaryModel,
+    UserProfileModel,
+    ContextualFactModel,
+    TopicTransitionModel
 )
 from app.services.enhanced_memory_service import get_enhanced_memory_service, EnhancedMemoryService
 from app.dependencies import get_current_user
@@ -58,16 +63,30 @@ async def retrieve_relevant_memory(
         # Calculate context quality score
         context_quality_score = _calculate_context_quality(relevant_history)
         
-        return MemoryRetrievalResponse(
+        # Memory records come from the memory service, so skip re-validating them
+        user_profile = relevant_history.get("user_profile")
+        response = MemoryRetrievalResponse(
             recent_context=relevant_history.get("recent_context", []),
-            relevant_facts=[],  # Will be populated from relevant_history
-            relevant_summaries=[],  # Will be populated from relevant_history
-            user_profile=None,  # Will be populated from relevant_history
+            relevant_facts=[
+                ContextualFactModel.build_trusted(**fact)
+                for fact in relevant_history.get("relevant_facts", [])
+            ],
+            relevant_summaries=[
+                ConversationSummaryModel.build_trusted(**summary)
+                for summary in relevant_history.get("relevant_summaries", [])
+            ],
+            user_profile=UserProfileModel.build_trusted(**user_profile) if user_profile else None,
             current_topic=relevant_history.get("current_topic", "general"),
-            topic_history=[],  # Will be populated from relevant_history
+            topic_history=[
+                TopicTransitionModel.build_trusted(**transition)
+                for transition in relevant_history.get("topic_history", [])
+            ],
             context_quality_score=context_quality_score
         )
         
+        # Serialize once in pydantic-core instead of FastAPI's encode-then-dump pass
+        return Response(content=response.model_dump_json(), media_type="application/json")
+        
     except Exception as e:
         logger.error(f"Error retrieving memory: {e}")
         raise HTTPException(
@@ -222,16 +241,9 @@ async def get_conversation_memory(
             user_id=user_id
         )
         
-        # Convert to response model
-        return ConversationMemoryModel(
-            conversation_id=memory.conversation_id,
-            short_term_memory=memory.short_term_memory,
-            long_term_memory=[],  # Convert summaries to models
-            user_profile=None,  # Convert profile to model
-            contextual_facts=[],  # Convert facts to models
-            topic_history=[],  # Convert transitions to models
-            last_updated=memory.last_updated
-        )
+        # Convert to response model; the memory service already produced these values
+        conversation_memory = ConversationMemoryModel.build_trusted(**asdict(memory))
+        return Response(content=conversation_memory.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error getting conversation memory: {e}")
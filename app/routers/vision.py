@@ -53,7 +53,7 @@ async def analyze_image(request: VisionAnalysisRequest):
         vision_service = get_vision_service()
         result = await vision_service.analyze_image(
             image_url=request.image_url,
-            analysis_type=request.analysis_type,
+            analysis_type=AnalysisType(request.analysis_type),
             custom_prompt=request.custom_prompt
         )
         
@@ -101,8 +101,7 @@ class ConversationIntelligenceService:
                 lead_potential=lead_potential,
                 topics_covered=topics_covered,
                 user_goals_identified=user_goals_identified,
-                knowledge_gaps_found=knowledge_gaps_found,
-                created_at=datetime.utcnow()
+                knowledge_gaps_found=knowledge_gaps_found
             )
             
             # Store intelligence data
@@ -126,8 +125,7 @@ class ConversationIntelligenceService:
                 lead_potential=0.3,
                 topics_covered=[],
                 user_goals_identified=[],
-                knowledge_gaps_found=[],
-                created_at=datetime.utcnow()
+                knowledge_gaps_found=[]
             )
     
     async def track_conversation_flow(
@@ -322,7 +320,7 @@ class ConversationIntelligenceService:
             score += min(0.3, len(context.knowledge_gaps) * 0.1)
         
         # Question context indicates proactive opportunities
-        if context.context_type.value in ["question", "request"]:
+        if context.context_type in ["question", "request"]:
             score += 0.2
         
         # Multiple messages indicate ongoing conversation
@@ -625,7 +623,7 @@ class ConversationIntelligenceService:
             else:
                 # Insert new record
                 intelligence_data["id"] = str(uuid.uuid4())
-                intelligence_data["createdAt"] = intelligence.created_at.isoformat()
+                intelligence_data["createdAt"] = intelligence.model_dump(mode='json', include={'created_at'})['created_at']
                 response = self.supabase_client.table("ConversationIntelligence").insert(
                     intelligence_data
                 ).execute()
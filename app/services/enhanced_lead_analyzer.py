@@ -212,6 +212,12 @@ class EnhancedLeadAnalyzer:
                 "context_required": False
             }
         }
+        
+        # Compile each pattern once instead of on every scanned message
+        for config in self.lead_signals.values():
+            config["compiled_patterns"] = [
+                re.compile(pattern, re.IGNORECASE) for pattern in config["patterns"]
+            ]
     
     def _initialize_qualification_framework(self):
         """Initialize BANT+ qualification framework."""
@@ -421,8 +427,8 @@ class EnhancedLeadAnalyzer:
             message_lower = message.lower()
             
             for signal_type, config in self.lead_signals.items():
-                for pattern in config["patterns"]:
-                    matches = re.finditer(pattern, message_lower, re.IGNORECASE)
+                for pattern in config["compiled_patterns"]:
+                    matches = pattern.finditer(message_lower)
                     
                     for match in matches:
                         # Extract context around the match
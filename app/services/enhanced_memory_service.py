@@ -6,6 +6,7 @@ user profile building, and contextual fact extraction.
 import logging
 import json
 import hashlib
+import sys
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
@@ -18,6 +19,16 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _intern(value: Any) -> Any:
+    """Intern strings from a small fixed vocabulary; pass other values (e.g. null columns) through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _as_datetime(value: Any) -> Any:
+    """Parse timestamps that round-tripped through ``json.dumps(default=str)`` back into datetimes."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
 class MemoryType(str, Enum):
     """Types of memory storage."""
     SHORT_TERM = "short_term"
@@ -39,6 +50,11 @@ class ConversationSummary:
     start_time: datetime
     end_time: datetime
     importance_score: float
+    
+    def __post_init__(self):
+        self.sentiment_trend = _intern(self.sentiment_trend)
+        self.start_time = _as_datetime(self.start_time)
+        self.end_time = _as_datetime(self.end_time)
 
 
 @dataclass
@@ -52,6 +68,11 @@ class UserProfile:
     satisfaction_history: List[float]
     interaction_patterns: Dict[str, Any]
     last_updated: datetime
+    
+    def __post_init__(self):
+        self.communication_style = _intern(self.communication_style)
+        self.technical_level = _intern(self.technical_level)
+        self.last_updated = _as_datetime(self.last_updated)
 
 
 @dataclass
@@ -64,6 +85,10 @@ class ContextualFact:
     confidence_score: float
     extracted_at: datetime
     relevance_score: float
+    
+    def __post_init__(self):
+        self.fact_type = _intern(self.fact_type)
+        self.extracted_at = _as_datetime(self.extracted_at)
 
 
 @dataclass
@@ -74,6 +99,10 @@ class TopicTransition:
     transition_time: datetime
     transition_type: str  # 'natural', 'abrupt', 'clarification'
     context_maintained: bool
+    
+    def __post_init__(self):
+        self.transition_type = _intern(self.transition_type)
+        self.transition_time = _as_datetime(self.transition_time)
 
 
 @dataclass
@@ -684,12 +713,16 @@ class EnhancedMemoryService:
             # Get current topic
             current_topic = await self.detect_current_topic(current_message)
             
+            # Query keywords are the same for every fact and summary
+            keywords = current_message.lower().split()[:5]
+            
             # Find relevant facts
             relevant_facts = []
             for fact in memory.contextual_facts:
-                if current_topic in fact.fact_text.lower() or any(
-                    keyword in fact.fact_text.lower() 
-                    for keyword in current_message.lower().split()[:5]
+                fact_text = fact.fact_text.lower()
+                if current_topic in fact_text or any(
+                    keyword in fact_text
+                    for keyword in keywords
                 ):
                     relevant_facts.append(fact)
             
@@ -700,9 +733,10 @@ class EnhancedMemoryService:
             # Find relevant summaries
             relevant_summaries = []
             for summary in memory.long_term_memory:
+                summary_text = summary.summary_text.lower()
                 if current_topic in summary.key_topics or any(
-                    keyword in summary.summary_text.lower()
-                    for keyword in current_message.lower().split()[:5]
+                    keyword in summary_text
+                    for keyword in keywords
                 ):
                     relevant_summaries.append(summary)
             
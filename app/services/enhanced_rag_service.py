@@ -308,8 +308,7 @@ class EnhancedRAGService:
                     lead_potential=0.3,
                     topics_covered=[],
                     user_goals_identified=[],
-                    knowledge_gaps_found=[],
-                    created_at=datetime.utcnow()
+                    knowledge_gaps_found=[]
                 ),
                 context_used=standard_response.context_used,
                 sources_count=standard_response.sources_count,
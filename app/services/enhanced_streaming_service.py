@@ -242,8 +242,7 @@ class EnhancedStreamingService:
             chunk_tokens = tokens[i:i + config.chunk_size]
             chunk_content = "".join(chunk_tokens)  # Don't add spaces since they're preserved as tokens
             
-            yield EnhancedStreamResponse(
-                type=StreamResponseType.TOKEN,
+            yield EnhancedStreamResponse.token(
                 content=chunk_content,
                 metadata={
                     "token_index": i,
@@ -7,6 +7,7 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import json
+from collections import Counter
 
 from ..models.escalation import (
     EscalationRequest, EscalationStatus, EscalationType, UrgencyLevel,
@@ -280,19 +281,17 @@ class EscalationTrackingService:
         # Calculate metrics
         total_escalations = len(filtered_escalations)
         
-        # Count by type
-        escalations_by_type = {}
-        for escalation_type in EscalationType:
-            escalations_by_type[escalation_type] = len([
-                e for e in filtered_escalations if e.escalation_type == escalation_type
-            ])
-        
-        # Count by urgency
-        escalations_by_urgency = {}
-        for urgency_level in UrgencyLevel:
-            escalations_by_urgency[urgency_level] = len([
-                e for e in filtered_escalations if e.urgency_level == urgency_level
-            ])
+        # Count by type and urgency in a single pass
+        type_counts = Counter(e.escalation_type for e in filtered_escalations)
+        urgency_counts = Counter(e.urgency_level for e in filtered_escalations)
+        counters = {
+            f"{escalation_type.value.lower()}_count": type_counts[escalation_type]
+            for escalation_type in EscalationType
+        }
+        counters.update(
+            (f"{urgency_level.value.lower()}_count", urgency_counts[urgency_level])
+            for urgency_level in UrgencyLevel
+        )
         
         # Calculate resolution metrics
         resolved_escalations = [
@@ -312,8 +311,7 @@ class EscalationTrackingService:
         
         return EscalationMetrics(
             total_escalations=total_escalations,
-            escalations_by_type=escalations_by_type,
-            escalations_by_urgency=escalations_by_urgency,
+            **counters,
             average_resolution_time=average_resolution_time,
             resolution_rate=resolution_rate
         )
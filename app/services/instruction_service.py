@@ -39,6 +39,9 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Breakdown keys, shared by every InstructionListResponse
+_INSTRUCTION_TYPES = tuple(t.value for t in InstructionType)
+
 
 class InstructionService:
     """Service for managing custom training instructions with vector embeddings."""
@@ -94,7 +97,7 @@ class InstructionService:
             db_data = {
                 'id': instruction_id,
                 'chatbotId': instruction_data.chatbot_id,
-                'type': instruction_data.type.value.upper(),  # Convert to enum format
+                'type': instruction_data.type.upper(),  # Convert to enum format
                 'title': instruction_data.title,
                 'content': instruction_data.content,
                 'priority': instruction_data.priority,
@@ -129,14 +132,10 @@ class InstructionService:
                 instruction = result.data[0]
                 response = self._map_db_to_response(instruction)
                 
-                # Add embedding to response for debugging purposes
                 if 'embedding' in instruction:
                     embedding = instruction['embedding']
                     embedding_length = len(embedding) if isinstance(embedding, list) else 0
                     logger.info(f"Created instruction with embedding length: {embedding_length}")
-                    # Store embedding in response for debugging (add as custom attribute)
-                    response.embedding = embedding
-                    response.embedding_length = embedding_length
                 
                 return response
             else:
@@ -268,7 +267,7 @@ class InstructionService:
             
             # Add fields that are being updated
             if update_data.type is not None:
-                db_update['type'] = update_data.type.value.upper()
+                db_update['type'] = update_data.type.upper()
             if update_data.title is not None:
                 db_update['title'] = update_data.title
             if update_data.content is not None:
@@ -553,10 +552,11 @@ class InstructionService:
     
     def _map_db_to_response(self, db_row: Dict[str, Any]) -> TrainingInstructionResponse:
         """Map database row to response model."""
-        return TrainingInstructionResponse(
+        # Rows were validated on write, so skip model validation
+        return TrainingInstructionResponse.build_trusted(
             id=db_row['id'],
             chatbot_id=db_row['chatbotId'],
-            type=InstructionType(db_row['type'].lower()),
+            type=InstructionType(db_row['type'].lower()).value,
             title=db_row['title'],
             content=db_row['content'],
             priority=db_row['priority'],
@@ -567,9 +567,9 @@ class InstructionService:
     
     def _calculate_type_breakdown(self, instructions: List[TrainingInstructionResponse]) -> Dict[str, int]:
         """Calculate breakdown of instructions by type."""
-        breakdown = {t.value: 0 for t in InstructionType}
+        breakdown = dict.fromkeys(_INSTRUCTION_TYPES, 0)
         for instruction in instructions:
-            breakdown[instruction.type.value] += 1
+            breakdown[instruction.type] += 1
         return breakdown
     
     def _calculate_cosine_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
@@ -644,7 +644,7 @@ class InstructionService:
         }
         
         if instruction.type in type_context:
-            explanation_parts.append(f"This {instruction.type.value} instruction is designed {type_context[instruction.type]}")
+            explanation_parts.append(f"This {instruction.type} instruction is designed {type_context[instruction.type]}")
         
         return ". ".join(explanation_parts) + "."
     
@@ -44,7 +44,6 @@ from fastapi import HTTPException
 from app.models.chat import (
     ChatRequest, 
     ChatResponse, 
-    RetrievedDocument, 
     RAGContext,
     ConversationMessage
 )
@@ -1380,7 +1379,8 @@ Please provide a helpful and detailed response that takes into account the conve
             # Construct context
             context, context_length = self._construct_context(retrieved_docs)
             
-            return RAGContext(
+            # Values are computed locally, so skip model validation
+            return RAGContext.model_construct(
                 query_embedding_generated=query_embedding_generated,
                 documents_retrieved=len(retrieved_docs),
                 context_length=context_length,
@@ -1390,7 +1390,7 @@ Please provide a helpful and detailed response that takes into account the conve
             
         except Exception as e:
             logger.error(f"Error getting RAG context: {e}")
-            return RAGContext(
+            return RAGContext.model_construct(
                 query_embedding_generated=False,
                 documents_retrieved=0,
                 context_length=0,